@@ -11,6 +11,16 @@
 A CircuitPython driver class that simulates the NAU7802 24-bit ADC. Used for
 code testing without a connected NAU7802 FeatherWing.
 
+Conversions are modeled from a load profile in grams for each channel with
+gain-dependent Gaussian noise, load cell creep, zero drift, and analog
+multiplexer settling after a channel switch. Conversions become available at
+the selected conversion rate. Pass a VirtualClock to run simulated time
+without waiting; sleeping advances the virtual clock instantly.
+
+  clock = VirtualClock()
+  nau7802 = FakeNAU7802(None, active_channels=2, clock=clock, seed=1)
+  nau7802.set_load(1, lambda t: 50 if t > 10 else 0)  # 50g placed at 10s
+
 
 * Author(s): JG
 
@@ -29,9 +39,37 @@ Implementation Notes
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/CedarGroveStudios/Cedargrove_CircuitPython_NAU7802.git"
 
+import math
 import time
 import random
 
+# Simulated load cell and ADC characteristics at gain 128
+_COUNTS_PER_GRAM = 1076.5  # Raw counts per gram (107650 counts per 100g)
+_NOISE = 40  # Noise standard deviation in raw counts
+_NOISE_FLOOR = 2  # Gain-independent noise standard deviation in raw counts
+_CREEP = 0.0005  # Load cell creep as a fraction of the applied load
+_CREEP_TIME = 300  # Creep time constant in seconds
+_DRIFT = 20  # Zero drift in raw counts per hour
+_GCAL_UNITY = 0x00800000  # Gain calibration register value for unity gain
+
+
+class VirtualClock:
+    """A simulated clock for FakeNAU7802. sleep() advances the clock without
+    waiting. monotonic can also be passed to NAU7802Emulator as its clock
+    function."""
+
+    def __init__(self, start=0.0):
+        self._now = start
+
+    def monotonic(self):
+        """The simulated time in seconds."""
+        return self._now
+
+    def sleep(self, seconds):
+        """Advance the simulated time by seconds."""
+        self._now += max(0, seconds)
+
+
 class LDOVoltage:
     LDO_3V0 = 0x5  # LDO 3.0 volts; _CTRL1[5:3] = 5
     LDO_2V7 = 0x6  # LDO 2.7 volts; _CTRL1[5:3] = 6
@@ -57,18 +95,101 @@ class ConversionRate:
     RATE_320SPS = 0x7  # 320 samples/sec; _CTRL2[6:4] = 7
 
 
+# Analog multiplexer channel settling time in seconds for each conversion rate
+_SETTLE_TIME = {10: 0.400, 20: 0.200, 40: 0.100, 80: 0.050, 320: 0.020}
+# Post-switch conversions to discard; conversions spanning the settling time
+_SETTLE_DISCARD = {10: 4, 20: 4, 40: 4, 80: 4, 320: 7}
+# Convergence tolerance in raw ADC counts between consecutive conversions
+_SETTLE_TOLERANCE = {10: 1024, 20: 1024, 40: 1024, 80: 1024, 320: 2048}
+
+
+class SettleMode:
+    """Channel switch settling strategy settings."""
+
+    SLEEP = 0x0  # Wait the fixed settling time for the conversion rate
+    DISCARD = 0x1  # Discard a fixed number of post-switch conversions
+    CONVERGE = 0x2  # Discard conversions until consecutive values converge
+
+
 class CalibrationMode:
     INTERNAL = 0x0  # Offset Calibration Internal; _CTRL2[1:0] = 0 (chip default)
     OFFSET = 0x2  # Offset Calibration System;   _CTRL2[1:0] = 2
     GAIN = 0x3  # Gain   Calibration System;   _CTRL2[1:0] = 3
 
 
+class _SampleStream:
+    """Asynchronous iterator of raw ADC conversions from a FakeNAU7802."""
+
+    def __init__(self, nau7802, samples=None):
+        self._nau7802 = nau7802
+        self._remaining = samples
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._remaining is not None:
+            if self._remaining <= 0:
+                raise StopAsyncIteration
+            self._remaining -= 1
+        return await self._nau7802.read_async()
+
+
 class FakeNAU7802:
-    def __init__(self, i2c_bus, address=0x2A, active_channels=1):
+    """Simulated NAU7802. The load cell model is adjusted with the attributes
+    counts_per_gram, noise, noise_floor, creep, creep_time, and drift; see the
+    module constants for units and defaults."""
+
+    def __init__(
+        self,
+        i2c_bus,
+        address=0x2A,
+        active_channels=1,
+        drdy_pin=None,
+        clock=None,
+        seed=None,
+    ):
         """Instantiate NAU7802; LDO 3v0 volts, gain 128, 10 samples per second
         conversion rate, disabled ADC chopper clock, low ESR caps, and PGA output
-        stabilizer cap if in single channel mode. Returns True if successful."""
+        stabilizer cap if in single channel mode. Returns True if successful.
+        drdy_pin is accepted for compatibility; a pin-level stand-in object with
+        a boolean value property is used by available() if provided. clock is
+        an optional VirtualClock; defaults to real time. seed is an optional
+        random number seed for repeatable noise."""
         # self.i2c_device = I2CDevice(i2c_bus, address)
+        if clock is None:
+            self._monotonic = time.monotonic
+            self._sleep = time.sleep
+        else:
+            self._monotonic = clock.monotonic
+            self._sleep = clock.sleep
+        self._virtual = clock is not None
+        if seed is not None:
+            random.seed(seed)
+        t0 = self._monotonic()
+        self._t_start = t0  # Zero drift reference time
+
+        self.counts_per_gram = _COUNTS_PER_GRAM
+        self.noise = _NOISE
+        self.noise_floor = _NOISE_FLOOR
+        self.creep = _CREEP
+        self.creep_time = _CREEP_TIME
+        self.drift = _DRIFT
+        self._loads = {1: 0, 2: 0}  # Load profile in grams per channel
+        self._creep_counts = {1: 0.0, 2: 0.0}  # Creep state per channel
+        self._creep_t = {1: t0, 2: t0}  # Creep state update time per channel
+        self._transient = 0.0  # Channel switch error at the switch time
+        self._switch_t = t0
+        self._adc_out = 0
+
+        self._settle_mode = "SLEEP"
+        self._settle_discard = dict(_SETTLE_DISCARD)
+        self._settle_tolerance = dict(_SETTLE_TOLERANCE)
+        self._settle_limit = 16  # Maximum CONVERGE mode conversions
+        self.reset_settle_stats()
+        self._calib_pending = False
+        self._calib_result = None
+        self._drdy = drdy_pin if hasattr(drdy_pin, "value") else None
         if not self.reset():
             raise RuntimeError("NAU7802 device could not be reset")
             return
@@ -78,7 +199,7 @@ class FakeNAU7802:
         self.ldo_voltage = "3V0"  # 3.0-volt internal analog power (AVDD)
         self._pu_ldo_source = True  # Internal analog power (AVDD)
         self.gain = 128  # X128
-        self._c2_conv_rate = ConversionRate.RATE_10SPS  # 10 SPS; default
+        self.conversion_rate = 10  # 10 SPS; default
         self._adc_chop_clock = 0x3  # 0x3 = Disable ADC chopper clock
         self._pga_ldo_mode = 0x0  # 0x0 = Use low ESR capacitors
         self._act_channels = active_channels
@@ -89,6 +210,12 @@ class FakeNAU7802:
             self._pc_cap_enable = (
                 0x0  # 0x0 = Disable PGA out stabilizer cap for dual channel use
             )
+        self._startup_time = self._monotonic() - t0
+
+    def set_load(self, channel, grams):
+        """Set the simulated load cell load of the channel in grams. grams is
+        a number or a function of the time in seconds returning a number."""
+        self._loads[channel] = grams
 
     @property
     def chip_revision(self):
@@ -96,6 +223,16 @@ class FakeNAU7802:
         self._rev_id = "15"
         return self._rev_id
 
+    @property
+    def startup_time(self):
+        """The time in seconds from instantiation to ready for use."""
+        return self._startup_time
+
+    @property
+    def drdy_pin(self):
+        """The data-ready pin-level stand-in object or None."""
+        return self._drdy
+
     @property
     def channel(self):
         """Selected channel number (1 or 2)."""
@@ -107,16 +244,125 @@ class FakeNAU7802:
         Analog multiplexer settling time was emperically determined to be
         approximately 400ms at 10SPS, 200ms at 20SPS, 100ms at 40SPS,
         50ms at 80SPS, and 20ms at 320SPS."""
-        if chan == 1:
-            self._c2_chan_select = 0x0
-            time.sleep(0.400)  # 400ms settling time for 10SPS
-        elif chan == 2 and self._act_channels == 2:
-            self._c2_chan_select = 0x1
-            time.sleep(0.400)  # 400ms settling time for 10SPS
-        else:
+        self._run(self._channel_steps(chan))
+        return
+
+    async def channel_async(self, chan=1):
+        """Awaitable channel selection. Yields to other tasks while the analog
+        multiplexer settles. Valid channel numbers are 1 and 2."""
+        await self._run_async(self._channel_steps(chan))
+
+    def channel_steps(self, chan=1):
+        """Non-blocking channel selection for a cooperative scheduler. Returns
+        the selection and settling step sequence: call next() on it, waiting
+        each yielded time in seconds, until StopIteration. The channel is
+        selected by the first step. Valid channel numbers are 1 and 2."""
+        return self._channel_steps(chan)
+
+    def _channel_steps(self, chan):
+        """Select the channel and settle; yields wait times in seconds."""
+        if self._calib_pending:
+            raise RuntimeError("NAU7802 calibration in progress")
+        if not (chan == 1 or (chan == 2 and self._act_channels == 2)):
             raise ValueError("Invalid Channel Number")
             return
-        return
+        if chan != self.channel:
+            # The analog input moves from the previous channel's level
+            now = self._monotonic()
+            self._transient = (
+                self._analog(self.channel, now) + self._residual(now)
+            ) - self._analog(chan, now)
+            self._switch_t = now
+        self._c2_chan_select = chan - 1
+        yield from self._settle_steps()
+
+    @property
+    def conversion_rate(self):
+        """The ADC conversion rate in samples per second."""
+        return self._conversion_rate
+
+    @conversion_rate.setter
+    def conversion_rate(self, rate=10):
+        """Select the ADC conversion rate. Valid rates are 10, 20, 40, 80, and
+        320 samples per second. Also sets the channel settling time."""
+        if not ("RATE_" + str(rate) + "SPS" in dir(ConversionRate)):
+            raise ValueError("Invalid Conversion Rate")
+        self._conversion_rate = rate
+        self._settle_time = _SETTLE_TIME[rate]
+        self._c2_conv_rate = getattr(ConversionRate, "RATE_" + str(rate) + "SPS")
+        self.start_conversion()
+
+    @property
+    def settle_time(self):
+        """The analog multiplexer channel settling time in seconds for the
+        selected conversion rate."""
+        return self._settle_time
+
+    @property
+    def settle_mode(self):
+        """The channel switch settling strategy."""
+        return self._settle_mode
+
+    @settle_mode.setter
+    def settle_mode(self, mode="SLEEP"):
+        """Select the channel switch settling strategy. Valid modes are 'SLEEP'
+        (fixed settling time), 'DISCARD' (discard settle_discard conversions),
+        and 'CONVERGE' (discard conversions until consecutive values are within
+        settle_tolerance, up to settle_limit conversions)."""
+        if not mode in dir(SettleMode):
+            raise ValueError("Invalid Settle Mode")
+        self._settle_mode = mode
+
+    @property
+    def settle_discard(self):
+        """The number of post-switch conversions discarded in DISCARD mode for
+        the selected conversion rate."""
+        return self._settle_discard[self._conversion_rate]
+
+    @settle_discard.setter
+    def settle_discard(self, conversions=4):
+        """Set the DISCARD mode conversion count for the selected conversion
+        rate."""
+        self._settle_discard[self._conversion_rate] = max(0, int(conversions))
+
+    @property
+    def settle_tolerance(self):
+        """The CONVERGE mode tolerance in raw ADC counts for the selected
+        conversion rate."""
+        return self._settle_tolerance[self._conversion_rate]
+
+    @settle_tolerance.setter
+    def settle_tolerance(self, counts=1024):
+        """Set the CONVERGE mode tolerance for the selected conversion rate."""
+        self._settle_tolerance[self._conversion_rate] = abs(int(counts))
+
+    @property
+    def settle_limit(self):
+        """The maximum number of conversions discarded in CONVERGE mode."""
+        return self._settle_limit
+
+    @settle_limit.setter
+    def settle_limit(self, conversions=16):
+        self._settle_limit = max(2, int(conversions))
+
+    @property
+    def settle_stats(self):
+        """Channel switch settling counters: a tuple of the number of channel
+        switches, conversions discarded by the last switch, total conversions
+        discarded, and the last settling duration in seconds."""
+        return (
+            self._settle_switches,
+            self._settle_last,
+            self._settle_total,
+            self._settle_duration,
+        )
+
+    def reset_settle_stats(self):
+        """Clear the channel switch settling counters."""
+        self._settle_switches = 0
+        self._settle_last = 0
+        self._settle_total = 0
+        self._settle_duration = 0.0
 
     @property
     def ldo_voltage(self):
@@ -169,40 +415,244 @@ class FakeNAU7802:
             self._c1_gains = Gain.GAIN_X128
         return
 
-    def enable(self, power=True):
+    def enable(self, power=True, timeout=1.0):
         """Enable(start) or disable(stop) the internal analog and digital
         systems power. Enable = True; Disable (low power) = False. Returns
         True when enabled; False when disabled."""
+        return self._run(self._enable_steps(power, timeout))
+
+    async def enable_async(self, power=True, timeout=1.0):
+        """Awaitable enable or disable of the internal analog and digital
+        systems power. Returns True when enabled; False when disabled."""
+        return await self._run_async(self._enable_steps(power, timeout))
+
+    def _enable_steps(self, power, timeout=1.0):
+        """Enable or disable system power; yields wait times in seconds.
+        Waits for the first conversion when enabled."""
         self._enable = power
         if self._enable:
-            time.sleep(0.750)  # Wait 750ms; minimum 400ms
+            self.start_conversion()
+            while not self.available():
+                yield self._conversion_wait()
             return True
-        time.sleep(0.010)  # Wait 10ms (200us minimum)
+        yield 0.010  # Wait 10ms (200us minimum)
         return False
 
+    def start_conversion(self):
+        """Restart the simulated conversion cycle."""
+        self._cycle_t = self._monotonic()
+        self._read_index = 0  # Number of the last conversion read
+        return
+
+    def _conversion_index(self):
+        """The number of the latest completed conversion since the conversion
+        cycle started."""
+        # Allow 1us for floating point rounding of the conversion times
+        return int(
+            (self._monotonic() - self._cycle_t + 0.000001) * self._conversion_rate
+        )
+
+    def _conversion_wait(self):
+        """The time in seconds until the next unread conversion is ready."""
+        if not self._enable or self._calib_pending:
+            return 0.001
+        ready = self._cycle_t + (self._read_index + 1) / self._conversion_rate
+        return max(0, ready - self._monotonic())
+
     def available(self):
         """Read the ADC data-ready status. True when data is available; False when
         ADC data is unavailable."""
-        return True
+        if self._drdy is not None:
+            return self._drdy.value
+        if not self._enable or self.calibration_pending():
+            return False
+        return self._conversion_index() > self._read_index
 
     def read(self):
         """Reads the 24-bit ADC data. Returns a signed integer value with
         24-bit resolution. Assumes that the ADC data-ready bit was checked
         to be True."""
-        self._adc_out = random.randrange(0, 16384)
+        index = self._conversion_index()
+        if not self._enable or index <= self._read_index:
+            return self._adc_out  # No new conversion; repeat the last one
+        self._read_index = index
+        self._adc_out = self._convert(self._cycle_t + index / self._conversion_rate)
         return self._adc_out
 
-    def reset(self):
+    def _analog(self, chan, t):
+        """The noise-free channel input in raw counts at time t before
+        calibration."""
+        grams = self._loads[chan]
+        if callable(grams):
+            grams = grams(t)
+        counts = grams * self.counts_per_gram
+        counts += self._creep_counts[chan]
+        counts += self.drift * (t - self._t_start) / 3600
+        return counts * self._gain / 128
+
+    def _residual(self, t):
+        """The decaying analog multiplexer switching error in raw counts at
+        time t."""
+        elapsed = max(0, t - self._switch_t)
+        # Settled to within 1/3000th of the switching error after settle_time
+        return self._transient * math.exp(-8 * elapsed / self._settle_time)
+
+    def _convert(self, t):
+        """Simulate a conversion of the selected channel completed at time t
+        with the channel's offset and gain calibration applied."""
+        chan = self.channel
+        grams = self._loads[chan]
+        if callable(grams):
+            grams = grams(t)
+        # Creep approaches a fraction of the applied load
+        dt = max(0, t - self._creep_t[chan])
+        target = self.creep * grams * self.counts_per_gram
+        self._creep_counts[chan] += (target - self._creep_counts[chan]) * (
+            1 - math.exp(-dt / self.creep_time)
+        )
+        self._creep_t[chan] = t
+
+        sigma = self.noise * self._gain / 128 + self.noise_floor
+        counts = self._analog(chan, t) + self._residual(t) + self._gauss(sigma)
+        offset, gain = self._calibration[chan]
+        if offset & 0x800000:
+            offset -= 0x1000000
+        value = int((counts - offset) * gain / _GCAL_UNITY)
+        return max(-0x800000, min(0x7FFFFF, value))
+
+    @staticmethod
+    def _gauss(sigma):
+        """A Gaussian random value with a standard deviation of sigma."""
+        u = 1.0 - random.random()  # Exclude zero
+        return (
+            sigma
+            * math.sqrt(-2 * math.log(u))
+            * math.cos(2 * math.pi * random.random())
+        )
+
+    async def read_async(self):
+        """Awaitable read of the next 24-bit ADC conversion. Yields to other
+        tasks until the ADC data-ready status is True."""
+        return await self._run_async(self._read_steps())
+
+    def stream(self, samples=None):
+        """Return an asynchronous iterator of raw ADC conversions for use with
+        'async for'. Provides the specified number of samples or runs
+        indefinitely if samples is None."""
+        return _SampleStream(self, samples)
+
+    def _read_steps(self):
+        """Wait for and read the next conversion; yields wait times."""
+        while not self.available():
+            yield self._conversion_wait()
+        return self.read()
+
+    def _settle_steps(self):
+        """Wait for the analog multiplexer to settle after a channel switch
+        using the selected settling strategy; yields wait times in seconds.
+        Updates the settling counters."""
+        t0 = self._monotonic()
+        conversions = 0
+        if self._settle_mode == "SLEEP":
+            yield self._settle_time  # Conversion rate settling time
+            while not self.available():
+                yield self._conversion_wait()
+        elif self._settle_mode == "DISCARD":
+            while conversions < self._settle_discard[self._conversion_rate]:
+                yield from self._read_steps()
+                conversions += 1
+        else:  # CONVERGE
+            tolerance = self._settle_tolerance[self._conversion_rate]
+            # The first conversion may have started before the switch
+            previous = yield from self._read_steps()
+            conversions = 1
+            while conversions < self._settle_limit:
+                value = yield from self._read_steps()
+                conversions += 1
+                if abs(value - previous) <= tolerance:
+                    break
+                previous = value
+        self._settle_switches += 1
+        self._settle_last = conversions
+        self._settle_total += conversions
+        self._settle_duration = self._monotonic() - t0
+
+    def _run(self, steps):
+        """Run a step sequence, sleeping for each yielded wait time in
+        seconds. Returns the step sequence result."""
+        try:
+            while True:
+                self._sleep(next(steps))
+        except StopIteration as result:
+            return result.value
+
+    async def _run_async(self, steps):
+        """Run a step sequence, yielding to other tasks for each yielded wait
+        time in seconds. A virtual clock is advanced instead of waiting.
+        Returns the step sequence result."""
+        import asyncio
+
+        try:
+            while True:
+                wait = next(steps)
+                if self._virtual:
+                    self._sleep(wait)
+                    wait = 0
+                await asyncio.sleep(wait)
+        except StopIteration as result:
+            return result.value
+
+    def sync(self):
+        """Refresh the register shadow cache; no registers to simulate."""
+        return
+
+    def invalidate(self):
+        """Discard the register shadow cache; no registers to simulate."""
+        return
+
+    def reset(self, timeout=1.0):
         """Resets all device registers and enables digital system power.
         Returns the power ready status bit value: True when system is ready;
         False when system not ready for use."""
-        time.sleep(0.100)  # Wait 100ms; 10ms minimum
-        time.sleep(0.750)  # Wait 750ms; 400ms minimum
+        return self._run(self._reset_steps(timeout))
+
+    async def reset_async(self, timeout=1.0):
+        """Awaitable reset of all device registers. Returns the power ready
+        status bit value."""
+        return await self._run_async(self._reset_steps(timeout))
+
+    def _reset_steps(self, timeout=1.0):
+        """Simulate a register reset; yields wait times in seconds."""
+        self._enable = False
+        self._c2_chan_select = 0x0
+        self._gain = 1  # Chip default
+        self.conversion_rate = 10  # Chip default
+        # Offset and gain calibration register chip defaults per channel
+        self._calibration = {1: (0x000000, _GCAL_UNITY), 2: (0x000000, _GCAL_UNITY)}
+        yield 0.010  # Wait 10ms minimum
         return True
 
     def calibrate(self, mode="INTERNAL"):
         """Perform the calibration procedure. Valid calibration modes
         are 'INTERNAL', 'OFFSET', and 'GAIN'. True if successful."""
+        return self._run(self._calibrate_steps(mode))
+
+    async def calibrate_async(self, mode="INTERNAL"):
+        """Awaitable calibration procedure. Yields to other tasks while the
+        calibration is in progress. True if successful."""
+        return await self._run_async(self._calibrate_steps(mode))
+
+    def _calibrate_steps(self, mode):
+        """Calibrate and wait for completion; yields wait times in seconds."""
+        self.start_calibration(mode)
+        while self.calibration_pending():
+            yield 0.010  # 10ms
+        return self.calibration_result()
+
+    def start_calibration(self, mode="INTERNAL"):
+        """Start the calibration procedure and return without waiting for
+        completion. Valid calibration modes are 'INTERNAL', 'OFFSET', and
+        'GAIN'. The simulated calibration takes two conversion periods."""
         if not (mode in dir(CalibrationMode)):
             raise ValueError("Invalid Calibration Mode")
             return
@@ -213,5 +663,59 @@ class FakeNAU7802:
             self._c2_cal_mode = CalibrationMode.OFFSET
         elif self._calib_mode == "GAIN":  # External PGA full-scale gain setting
             self._c2_cal_mode = CalibrationMode.GAIN
-        time.sleep(0.010)  # 10ms
+        self._calib_result = None
+        self._calib_done = self._monotonic() + 2 / self._conversion_rate
+        self._calib_pending = True
+        return
+
+    def calibration_pending(self):
+        """True while a calibration started by start_calibration() is in
+        progress; False when complete or if no calibration was started."""
+        if not self._calib_pending:
+            return False
+        if self._monotonic() < self._calib_done:
+            return True
+        self._calib_pending = False
+        self._calib_result = self._calibrate(self._calib_done)
+        self.start_conversion()
+        return False
+
+    def _calibrate(self, t):
+        """Complete the calibration of the selected channel at time t. Returns
+        False if a gain calibration span is not positive; True otherwise."""
+        chan = self.channel
+        offset, gain = self._calibration[chan]
+        if offset & 0x800000:
+            offset -= 0x1000000
+        counts = self._analog(chan, t) + self._residual(t)
+        if self._calib_mode == "OFFSET":
+            offset = int(counts) & 0xFFFFFF
+        elif self._calib_mode == "GAIN":
+            span = counts - offset
+            if span <= 0:
+                return False
+            gain = min(0xFFFFFFFF, int(0x7FFFFF * _GCAL_UNITY / span))
+        self._calibration[chan] = (offset & 0xFFFFFF, gain)
         return True
+
+    def save_calibration(self, channel=None):
+        """Return the simulated offset and gain calibration register values
+        for the channel (defaults to the selected channel)."""
+        if channel is None:
+            channel = self.channel
+        return self._calibration[channel]
+
+    def load_calibration(self, calibration, channel=None):
+        """Store simulated offset and gain calibration register values for the
+        channel (defaults to the selected channel)."""
+        if channel is None:
+            channel = self.channel
+        offset, gain = calibration
+        self._calibration[channel] = (offset & 0xFFFFFF, gain & 0xFFFFFFFF)
+        return
+
+    def calibration_result(self):
+        """The result of the last completed calibration: True if successful,
+        False if the calibration failed, or None if no calibration has
+        completed."""
+        return self._calib_result
@@ -0,0 +1,260 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# cedargrove_i2c_trace.py  2026-10-18 v1.0  Cedar Grove Maker Studios
+
+
+"""
+`cedargrove_i2c_trace`
+================================================================================
+
+Record-and-replay I2C transport. RecordingI2C wraps a busio.I2C bus and writes
+every transaction with a microsecond timestamp to a compact binary trace.
+ReplayI2C reads a trace and acts as the bus, returning the recorded read data
+without hardware. Either object can be passed to the NAU7802 driver in place of
+board.I2C().
+
+  with open("/nau7802.trace", "wb") as trace:
+      nau7802 = NAU7802(RecordingI2C(board.I2C(), trace), active_channels=2)
+      ...
+
+  with open("nau7802.trace", "rb") as trace:
+      nau7802 = NAU7802(ReplayI2C(trace), active_channels=2)
+
+Trace format: the header b"I2CT" and a version byte, followed by one record per
+transaction. Each record is a struct ">BBLHH" of kind (1 write, 2 read,
+3 write then read), address, microseconds since the start of recording,
+write length, and read length, followed by the write bytes and the read bytes.
+
+* Author(s): JG
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+import time
+import struct
+
+_MAGIC = b"I2CT"
+_VERSION = 1
+_RECORD = ">BBLHH"
+_RECORD_SIZE = struct.calcsize(_RECORD)
+_WRITE = 1
+_READ = 2
+_WRITE_READ = 3
+
+
+class RecordingI2C:
+    """An I2C bus wrapper that records every transaction to a binary trace
+    stream."""
+
+    def __init__(self, i2c_bus, stream):
+        """:param class i2c_bus: The busio.I2C bus to record.
+        :param stream: A writable binary stream such as an open file."""
+        self._i2c = i2c_bus
+        self._stream = stream
+        self._header = bytearray(_RECORD_SIZE)
+        self._t0 = time.monotonic_ns()
+        self.records = 0
+        self._stream.write(_MAGIC + bytes([_VERSION]))
+
+    def _record(self, kind, address, out_data, in_data):
+        elapsed = ((time.monotonic_ns() - self._t0) // 1000) & 0xFFFFFFFF
+        struct.pack_into(
+            _RECORD,
+            self._header,
+            0,
+            kind,
+            address,
+            elapsed,
+            len(out_data),
+            len(in_data),
+        )
+        self._stream.write(self._header)
+        if out_data:
+            self._stream.write(out_data)
+        if in_data:
+            self._stream.write(in_data)
+        self.records += 1
+
+    def try_lock(self):
+        return self._i2c.try_lock()
+
+    def unlock(self):
+        self._i2c.unlock()
+
+    def scan(self):
+        return self._i2c.scan()
+
+    def deinit(self):
+        self._i2c.deinit()
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        if end is None:
+            end = len(buffer)
+        self._i2c.writeto(address, buffer, start=start, end=end)
+        self._record(_WRITE, address, memoryview(buffer)[start:end], b"")
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        if end is None:
+            end = len(buffer)
+        self._i2c.readfrom_into(address, buffer, start=start, end=end)
+        self._record(_READ, address, b"", memoryview(buffer)[start:end])
+
+    def writeto_then_readfrom(
+        self,
+        address,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None,
+    ):
+        if out_end is None:
+            out_end = len(buffer_out)
+        if in_end is None:
+            in_end = len(buffer_in)
+        # Copy the write data first; buffer_out and buffer_in may be the same
+        out_data = bytes(memoryview(buffer_out)[out_start:out_end])
+        self._i2c.writeto_then_readfrom(
+            address,
+            buffer_out,
+            buffer_in,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        self._record(
+            _WRITE_READ, address, out_data, memoryview(buffer_in)[in_start:in_end]
+        )
+
+
+class ReplayI2C:
+    """An I2C bus stand-in that replays a recorded binary trace."""
+
+    def __init__(self, stream, strict=False):
+        """:param stream: A readable binary stream containing a trace.
+        :param bool strict: If True, every transaction must match the next
+        recorded transaction exactly. If False, recorded transactions are
+        skipped until one with the same kind, address, write data, and read
+        length is found; a driver that polls less often than the recorded
+        driver can then replay the same trace. Defaults to False."""
+        data = stream.read()
+        if data[0:4] != _MAGIC or data[4] != _VERSION:
+            raise ValueError("Invalid I2C trace")
+        self._records = []
+        index = 5
+        while index + _RECORD_SIZE <= len(data):
+            kind, address, elapsed, out_len, in_len = struct.unpack_from(
+                _RECORD, data, index
+            )
+            index += _RECORD_SIZE
+            out_data = data[index : index + out_len]
+            index += out_len
+            in_data = data[index : index + in_len]
+            index += in_len
+            self._records.append((kind, address, elapsed, out_data, in_data))
+        self._strict = strict
+        self._position = 0
+        self._locked = False
+        self.transactions = 0
+        self.skipped = 0
+
+    def __len__(self):
+        return len(self._records)
+
+    @property
+    def position(self):
+        """The index of the next record to be replayed."""
+        return self._position
+
+    @property
+    def trace_time(self):
+        """The recorded time in seconds of the most recently replayed
+        transaction. Use as a virtual clock when benchmarking."""
+        if self._position == 0:
+            return 0.0
+        return self._records[self._position - 1][2] / 1000000
+
+    def try_lock(self):
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self):
+        self._locked = False
+
+    def scan(self):
+        return sorted(set(record[1] for record in self._records))
+
+    def deinit(self):
+        return
+
+    def _next(self, kind, address, out_data, in_len=0):
+        """Return the read data of the next matching record. A record matches
+        if the kind, address, write data, and read length are the same."""
+        position = self._position
+        while position < len(self._records):
+            record = self._records[position]
+            position += 1
+            if (
+                record[0] == kind
+                and record[1] == address
+                and record[3] == out_data
+                and len(record[4]) == in_len
+            ):
+                self.skipped += position - self._position - 1
+                self._position = position
+                self.transactions += 1
+                return record[4]
+            if self._strict:
+                break
+        raise RuntimeError(
+            "I2C trace mismatch at record %d: kind %d address 0x%02X read %d"
+            % (self._position, kind, address, in_len)
+        )
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        if end is None:
+            end = len(buffer)
+        self._next(_WRITE, address, bytes(memoryview(buffer)[start:end]))
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        if end is None:
+            end = len(buffer)
+        in_data = self._next(_READ, address, b"", end - start)
+        buffer[start:end] = in_data
+
+    def writeto_then_readfrom(
+        self,
+        address,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None,
+    ):
+        if out_end is None:
+            out_end = len(buffer_out)
+        if in_end is None:
+            in_end = len(buffer_in)
+        out_data = bytes(memoryview(buffer_out)[out_start:out_end])
+        in_data = self._next(_WRITE_READ, address, out_data, in_end - in_start)
+        buffer_in[in_start:in_end] = in_data
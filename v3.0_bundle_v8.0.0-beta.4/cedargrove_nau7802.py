@@ -6,7 +6,7 @@
 ================================================================================
 
 A CircuitPython driver class for the NAU7802 24-bit ADC. Supports dual analog
-inputs.
+inputs. Methods that wait on the device have asyncio awaitable counterparts.
 
 
 * Author(s): JG
@@ -29,18 +29,16 @@ Implementation Notes
 
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 * Adafruit's Register library: https://github.com/adafruit/Adafruit_CircuitPython_Register
+* Adafruit's asyncio library (awaitable methods only):
+  https://github.com/adafruit/Adafruit_CircuitPython_asyncio
 """
 
 import time
-import struct
 
 from adafruit_bus_device.i2c_device import I2CDevice
-from adafruit_register.i2c_struct import ROUnaryStruct
 
 # from adafruit_register.i2c_struct   import UnaryStruct
-from adafruit_register.i2c_bits import RWBits
 from adafruit_register.i2c_bits import ROBits
-from adafruit_register.i2c_bit import RWBit
 from adafruit_register.i2c_bit import ROBit
 
 __version__ = "0.0.0+auto.0"
@@ -50,6 +48,10 @@ __repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
 _PU_CTRL = 0x00  # Power-Up Control RW
 _CTRL1 = 0x01  # Control 1 RW
 _CTRL2 = 0x02  # Control 2 RW
+_OCAL1_B2 = 0x03  # Channel 1 Offset Calibration OCAL1[23:16] RW
+_GCAL1_B3 = 0x06  # Channel 1 Gain Calibration GCAL1[31:24] RW
+_OCAL2_B2 = 0x0A  # Channel 2 Offset Calibration OCAL2[23:16] RW
+_GCAL2_B3 = 0x0D  # Channel 2 Gain Calibration GCAL2[31:24] RW
 _ADCO_B2 = 0x12  # ADC_OUT[23:16] R-
 _ADCO_B1 = 0x13  # ADC_OUT[16: 8] R-
 _ADCO_B0 = 0x14  # ADC_OUT[ 7: 0] R-
@@ -60,6 +62,16 @@ _PGA = 0x1B  # Programmable Gain Amplifier  RW
 _PWR_CTRL = 0x1C  # Power Control  RW
 _REV_ID = 0x1F  # Chip Revision ID  R-
 
+# Registers held in the shadow cache
+_SHADOWED = (_PU_CTRL, _CTRL1, _CTRL2, _ADC, _PGA, _PWR_CTRL)
+# Write-only shadowed registers; reading _ADC returns OTP data
+_WRITE_ONLY = (_ADC,)
+# Shadowed register bits changed by the device; never cached
+_VOLATILE = {_PU_CTRL: 0x28, _CTRL2: 0x0C}  # PUR, CR; CALS, CAL_ERR
+# Shadowed register values following a register reset (RR)
+_RESET_VALUES = {_PU_CTRL: 0x01, _CTRL1: 0x00, _CTRL2: 0x00}
+
+
 # pylint: disable=too-few-public-methods
 class LDOVoltage:
     """Internal low-dropout voltage regulator settings."""
@@ -92,6 +104,24 @@ class ConversionRate:
     RATE_320SPS = 0x7  # 320 samples/sec; _CTRL2[6:4] = 7
 
 
+# Analog multiplexer channel settling time in seconds for each conversion rate
+_SETTLE_TIME = {10: 0.400, 20: 0.200, 40: 0.100, 80: 0.050, 320: 0.020}
+# Post-switch conversions to discard; conversions spanning the settling time
+_SETTLE_DISCARD = {10: 4, 20: 4, 40: 4, 80: 4, 320: 7}
+# Convergence tolerance in raw ADC counts between consecutive conversions
+_SETTLE_TOLERANCE = {10: 1024, 20: 1024, 40: 1024, 80: 1024, 320: 2048}
+# Data-ready polls per conversion period when polling over I2C
+_POLLS_PER_CONVERSION = 8
+
+
+class SettleMode:
+    """Channel switch settling strategy settings."""
+
+    SLEEP = 0x0  # Wait the fixed settling time for the conversion rate
+    DISCARD = 0x1  # Discard a fixed number of post-switch conversions
+    CONVERGE = 0x2  # Discard conversions until consecutive values converge
+
+
 class CalibrationMode:
     """Calibration mode state settings."""
 
@@ -100,83 +130,168 @@ class CalibrationMode:
     GAIN = 0x3  # Gain   Calibration System;   _CTRL2[1:0] = 3
 
 
+class _ShadowBits:
+    """Multi-bit register field backed by the NAU7802 register shadow cache.
+    Writes are sent to the device only when the register value changes."""
+
+    def __init__(self, num_bits, register_address, lowest_bit):
+        self.bit_mask = ((1 << num_bits) - 1) << lowest_bit
+        self.register = register_address
+        self.lowest_bit = lowest_bit
+
+    def __get__(self, obj, objtype=None):
+        return (obj._shadow_read(self.register) & self.bit_mask) >> self.lowest_bit
+
+    def __set__(self, obj, value):
+        reg = obj._shadow_read(self.register) & ~self.bit_mask
+        reg = reg | ((int(value) << self.lowest_bit) & self.bit_mask)
+        obj._shadow_write(self.register, reg)
+
+
+class _ShadowBit(_ShadowBits):
+    """Single register bit backed by the NAU7802 register shadow cache."""
+
+    def __init__(self, register_address, bit):
+        super().__init__(1, register_address, bit)
+
+    def __get__(self, obj, objtype=None):
+        return bool(super().__get__(obj, objtype))
+
+
+class _SampleStream:
+    """Asynchronous iterator of raw ADC conversions from an NAU7802."""
+
+    def __init__(self, nau7802, samples=None):
+        self._nau7802 = nau7802
+        self._remaining = samples
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._remaining is not None:
+            if self._remaining <= 0:
+                raise StopAsyncIteration
+            self._remaining -= 1
+        return await self._nau7802.read_async()
+
+
 class NAU7802:
     """The primary NAU7802 class."""
 
     # pylint: disable=too-many-instance-attributes
-    def __init__(self, i2c_bus, address=0x2A, active_channels=1):
+    def __init__(self, i2c_bus, address=0x2A, active_channels=1, drdy_pin=None):
         """Instantiate NAU7802; LDO 3v0 volts, gain 128, 10 samples per second
         conversion rate, disabled ADC chopper clock, low ESR caps, and PGA output
-        stabilizer cap if in single channel mode."""
+        stabilizer cap if in single channel mode. If drdy_pin is specified, the
+        data-ready status is read from the NAU7802 DRDY output pin rather than
+        polled over I2C. drdy_pin is a board pin or any object with a boolean
+        value property such as a DigitalInOut instance. The time from
+        instantiation to ready is available from the startup_time property."""
+        t0 = time.monotonic()
         self.i2c_device = I2CDevice(i2c_bus, address)
+        self._reg_buf = bytearray(2)  # Register address and value buffer
+        self._shadow = {}  # Register shadow cache; address: value
+        self._dirty = None  # Deferred register writes when batching
+        self._settle_mode = "SLEEP"
+        self._settle_discard = dict(_SETTLE_DISCARD)
+        self._settle_tolerance = dict(_SETTLE_TOLERANCE)
+        self._settle_limit = 16  # Maximum CONVERGE mode conversions
+        self.reset_settle_stats()
+        self._drdy = None
+        if drdy_pin is not None:
+            if hasattr(drdy_pin, "value"):
+                self._drdy = drdy_pin  # DigitalInOut or pin-level stand-in
+            else:
+                import digitalio
+
+                self._drdy = digitalio.DigitalInOut(drdy_pin)
+                self._drdy.direction = digitalio.Direction.INPUT
         if not self.reset():
             raise RuntimeError("NAU7802 device could not be reset")
         if not self.enable(True):
             raise RuntimeError("NAU7802 device could not be enabled")
+        # Compose the configuration registers and write them as one batch
+        self._dirty = []
         self.ldo_voltage = "3V0"  # 3.0-volt internal analog power (AVDD)
         self._pu_ldo_source = True  # Internal analog power (AVDD)
         self.gain = 128  # X128
-        self._c2_conv_rate = ConversionRate.RATE_10SPS  # 10SPS default
+        self.conversion_rate = 10  # 10SPS default
         self._adc_chop_clock = 0x3  # 0x3 = Disable ADC chopper clock
         self._pga_ldo_mode = 0x0  # 0x0 = Use low ESR capacitors
+        if self._drdy is not None:
+            self._c1_drdy_select = False  # DRDY pin signals conversion ready
+            self._c1_drdy_polarity = False  # DRDY pin is active high
         self._act_channels = active_channels
         # 0x1 = Enable PGA out stabilizer cap for single channel use
         self._pc_cap_enable = 0x1
         if self._act_channels == 2:
             # 0x0 = Disable PGA out stabilizer cap for dual channel use
             self._pc_cap_enable = 0x0
+        self._flush()
         self._calib_mode = None  # Initialize for later use
+        self._calib_pending = False
+        self._calib_result = None
         self._adc_out = None  # Initialize for later use
+        # Preallocated ADC result burst read buffers; ADCO_B2 to ADCO_B0
+        self._adc_reg = bytes([_ADCO_B2])
+        self._adc_buf = bytearray(3)
+        self._startup_time = time.monotonic() - t0
 
     # DEFINE I2C DEVICE BITS, NYBBLES, BYTES, AND REGISTERS
     # Chip Revision  R-
     _rev_id = ROBits(4, _REV_ID, 0, 1, False)
     # Register Reset  (RR)  RW
-    _pu_reg_reset = RWBit(_PU_CTRL, 0, 1, False)
+    _pu_reg_reset = _ShadowBit(_PU_CTRL, 0)
     # Power-Up Digital Circuit  (PUD) RW
-    _pu_digital = RWBit(_PU_CTRL, 1, 1, False)
+    _pu_digital = _ShadowBit(_PU_CTRL, 1)
     # Power-Up Analog Circuit  (PUA) RW
-    _pu_analog = RWBit(_PU_CTRL, 2, 1, False)
+    _pu_analog = _ShadowBit(_PU_CTRL, 2)
     # Power-Up Ready Status  (PUR) R-
     _pu_ready = ROBit(_PU_CTRL, 3, 1, False)
     # Power-Up Conversion Cycle Start  (CS) RW
-    _pu_cycle_start = RWBit(_PU_CTRL, 4, 1, False)
+    _pu_cycle_start = _ShadowBit(_PU_CTRL, 4)
     # Power-Up Cycle Ready  (CR) R-
     _pu_cycle_ready = ROBit(_PU_CTRL, 5, 1, False)
     # Power-Up AVDD Source  ADDS) RW
-    _pu_ldo_source = RWBit(_PU_CTRL, 7, 1, False)
+    _pu_ldo_source = _ShadowBit(_PU_CTRL, 7)
     # Control_1 Gain  (GAINS) RW
-    _c1_gains = RWBits(3, _CTRL1, 0, 1, False)
+    _c1_gains = _ShadowBits(3, _CTRL1, 0)
     # Control_1 LDO Voltage  (VLDO) RW
-    _c1_vldo_volts = RWBits(3, _CTRL1, 3, 1, False)
+    _c1_vldo_volts = _ShadowBits(3, _CTRL1, 3)
+    # Control_1 DRDY Pin Function  (DRDY_SEL) RW
+    _c1_drdy_select = _ShadowBit(_CTRL1, 6)
+    # Control_1 Conversion Ready Pin Polarity  (CRP) RW
+    _c1_drdy_polarity = _ShadowBit(_CTRL1, 7)
     # Control_2 Calibration Mode  (CALMOD) RW
-    _c2_cal_mode = RWBits(2, _CTRL2, 0, 1, False)
-    # Control_2 Calibration Start  (CALS) RW
-    _c2_cal_start = RWBit(_CTRL2, 2, 1, False)
-    # Control_2 Calibration Error (CAL_ERR) RW
-    _c2_cal_error = RWBit(_CTRL2, 3, 1, False)
+    _c2_cal_mode = _ShadowBits(2, _CTRL2, 0)
+    # Control_2 Calibration Start  (CALS) -W
+    _c2_cal_start = _ShadowBit(_CTRL2, 2)
+    # Control_2 Calibration Active  (CALS) R-
+    _c2_cal_active = ROBit(_CTRL2, 2, 1, False)
+    # Control_2 Calibration Error (CAL_ERR) R-
+    _c2_cal_error = ROBit(_CTRL2, 3, 1, False)
     # Control_2 Conversion Rate  (CRS) RW
-    _c2_conv_rate = RWBits(3, _CTRL2, 4, 1, False)
+    _c2_conv_rate = _ShadowBits(3, _CTRL2, 4)
     # Control_2 Channel Select  (CHS) RW
-    _c2_chan_select = RWBit(_CTRL2, 7, 1, False)
-    # ADC Result Output  MSByte R-
-    _adc_out_2 = ROUnaryStruct(_ADCO_B2, ">B")
-    # ADC Result Output  MidSByte R-
-    _adc_out_1 = ROUnaryStruct(_ADCO_B1, ">B")
-    # ADC Result Output  LSByte R-
-    _adc_out_0 = ROUnaryStruct(_ADCO_B0, ">B")
+    _c2_chan_select = _ShadowBit(_CTRL2, 7)
     # ADC Chopper Clock Frequency Select  -W
-    _adc_chop_clock = RWBits(2, _ADC, 4, 1, False)
+    _adc_chop_clock = _ShadowBits(2, _ADC, 4)
     # PGA Stability/Accuracy Mode (LDOMODE) RW
-    _pga_ldo_mode = RWBit(_PGA, 6, 1, False)
+    _pga_ldo_mode = _ShadowBit(_PGA, 6)
     # Power_Ctrl PGA Capacitor (PGA_CAP_EN) RW
-    _pc_cap_enable = RWBit(_PWR_CTRL, 7, 1, False)
+    _pc_cap_enable = _ShadowBit(_PWR_CTRL, 7)
 
     @property
     def chip_revision(self):
         """The chip revision code."""
         return self._rev_id
 
+    @property
+    def startup_time(self):
+        """The time in seconds from instantiation to ready for use."""
+        return self._startup_time
+
     @property
     def channel(self):
         "Selected channel number (1 or 2)."
@@ -186,6 +301,24 @@ class NAU7802:
     def channel(self, chan=1):
         """Select the active channel. Valid channel numbers are 1 and 2."""
 
+        self._run(self._channel_steps(chan))
+
+    async def channel_async(self, chan=1):
+        """Awaitable channel selection. Yields to other tasks while the analog
+        multiplexer settles. Valid channel numbers are 1 and 2."""
+        await self._run_async(self._channel_steps(chan))
+
+    def channel_steps(self, chan=1):
+        """Non-blocking channel selection for a cooperative scheduler. Returns
+        the selection and settling step sequence: call next() on it, waiting
+        each yielded time in seconds, until StopIteration. The channel is
+        selected by the first step. Valid channel numbers are 1 and 2."""
+        return self._channel_steps(chan)
+
+    def _channel_steps(self, chan):
+        """Select the channel and settle; yields wait times in seconds."""
+        if self._calib_pending:
+            raise RuntimeError("NAU7802 calibration in progress")
         if chan == 1:
             self._c2_chan_select = 0x0
         elif chan == 2 and self._act_channels == 2:
@@ -193,9 +326,94 @@ class NAU7802:
         else:
             raise ValueError("Invalid Channel Number")
 
-        time.sleep(0.500)  # Fixed settling time
-        while not self._pu_cycle_ready:
-            pass
+        yield from self._settle_steps()
+
+    @property
+    def conversion_rate(self):
+        """The ADC conversion rate in samples per second."""
+        return self._conversion_rate
+
+    @conversion_rate.setter
+    def conversion_rate(self, rate=10):
+        """Select the ADC conversion rate. Valid rates are 10, 20, 40, 80, and
+        320 samples per second. Also sets the channel settling time."""
+        if not "RATE_" + str(rate) + "SPS" in dir(ConversionRate):
+            raise ValueError("Invalid Conversion Rate")
+        self._conversion_rate = rate
+        self._settle_time = _SETTLE_TIME[rate]
+        self._c2_conv_rate = getattr(ConversionRate, "RATE_" + str(rate) + "SPS")
+
+    @property
+    def settle_time(self):
+        """The analog multiplexer channel settling time in seconds for the
+        selected conversion rate."""
+        return self._settle_time
+
+    @property
+    def settle_mode(self):
+        """The channel switch settling strategy."""
+        return self._settle_mode
+
+    @settle_mode.setter
+    def settle_mode(self, mode="SLEEP"):
+        """Select the channel switch settling strategy. Valid modes are 'SLEEP'
+        (fixed settling time), 'DISCARD' (discard settle_discard conversions),
+        and 'CONVERGE' (discard conversions until consecutive values are within
+        settle_tolerance, up to settle_limit conversions)."""
+        if not mode in dir(SettleMode):
+            raise ValueError("Invalid Settle Mode")
+        self._settle_mode = mode
+
+    @property
+    def settle_discard(self):
+        """The number of post-switch conversions discarded in DISCARD mode for
+        the selected conversion rate."""
+        return self._settle_discard[self._conversion_rate]
+
+    @settle_discard.setter
+    def settle_discard(self, conversions=4):
+        """Set the DISCARD mode conversion count for the selected conversion
+        rate."""
+        self._settle_discard[self._conversion_rate] = max(0, int(conversions))
+
+    @property
+    def settle_tolerance(self):
+        """The CONVERGE mode tolerance in raw ADC counts for the selected
+        conversion rate."""
+        return self._settle_tolerance[self._conversion_rate]
+
+    @settle_tolerance.setter
+    def settle_tolerance(self, counts=1024):
+        """Set the CONVERGE mode tolerance for the selected conversion rate."""
+        self._settle_tolerance[self._conversion_rate] = abs(int(counts))
+
+    @property
+    def settle_limit(self):
+        """The maximum number of conversions discarded in CONVERGE mode."""
+        return self._settle_limit
+
+    @settle_limit.setter
+    def settle_limit(self, conversions=16):
+        self._settle_limit = max(2, int(conversions))
+
+    @property
+    def settle_stats(self):
+        """Channel switch settling counters: a tuple of the number of channel
+        switches, conversions discarded by the last switch, total conversions
+        discarded, and the last settling duration in seconds."""
+        return (
+            self._settle_switches,
+            self._settle_last,
+            self._settle_total,
+            self._settle_duration,
+        )
+
+    def reset_settle_stats(self):
+        """Clear the channel switch settling counters."""
+        self._settle_switches = 0
+        self._settle_last = 0
+        self._settle_total = 0
+        self._settle_duration = 0.0
 
     @property
     def ldo_voltage(self):
@@ -244,53 +462,267 @@ class NAU7802:
         elif self._gain == 128:
             self._c1_gains = Gain.GAIN_X128
 
-    def enable(self, power=True):
+    def enable(self, power=True, timeout=1.0):
         """Enable(start) or disable(stop) the internal analog and digital
         systems power. Enable = True; Disable (low power) = False. Returns
-        True when enabled; False when disabled."""
+        True when enabled; False when disabled or if the first conversion is
+        not ready within timeout seconds."""
+        return self._run(self._enable_steps(power, timeout))
+
+    async def enable_async(self, power=True, timeout=1.0):
+        """Awaitable enable or disable of the internal analog and digital
+        systems power. Returns True when enabled; False when disabled."""
+        return await self._run_async(self._enable_steps(power, timeout))
+
+    def _enable_steps(self, power, timeout=1.0):
+        """Enable or disable system power; yields wait times in seconds. When
+        enabling, polls for power ready and the first completed conversion
+        cycle rather than waiting a fixed time. Gives up after timeout
+        seconds."""
         self._enable = power
         if self._enable:
             self._pu_analog = True
             self._pu_digital = True
-            time.sleep(0.750)  # Wait 750ms; minimum 400ms
-            self._pu_start = True  # Start acquisition system cycling
-            return self._pu_ready
+            self._pu_cycle_start = True  # Start acquisition system cycling
+            t0 = time.monotonic()
+            while not (self._pu_ready and self.available()):
+                if time.monotonic() - t0 > timeout:
+                    return False
+                yield 0.001  # Poll every 1ms
+            return True
         self._pu_analog = False
         self._pu_digital = False
-        time.sleep(0.010)  # Wait 10ms (200us minimum)
+        yield 0.010  # Wait 10ms (200us minimum)
         return False
 
+    @property
+    def drdy_pin(self):
+        """The data-ready input pin object or None if data-ready is polled
+        over I2C."""
+        return self._drdy
+
+    def start_conversion(self):
+        """Restart the conversion cycle. The next conversion is synchronized
+        to this call; use to align conversions across several devices."""
+        self._pu_cycle_start = False
+        self._pu_cycle_start = True
+
     def available(self):
         """Read the ADC data-ready status. True when data is available; False when
-        ADC data is unavailable."""
+        ADC data is unavailable. Uses the DRDY pin level when a data-ready pin
+        was specified, otherwise reads the cycle ready bit over I2C."""
+        if self._drdy is not None:
+            return self._drdy.value
         return self._pu_cycle_ready
 
     def read(self):
         """Reads the 24-bit ADC data. Returns a signed integer value with
         24-bit resolution. Assumes that the ADC data-ready bit was checked
-        to be True."""
-        adc = self._adc_out_2 << 24  # [31:24] << MSByte
-        adc = adc | (self._adc_out_1 << 16)  # [23:16] << MidSByte
-        adc = adc | (self._adc_out_0 << 8)  # [15: 8] << LSByte
-        adc = adc.to_bytes(4, "big")  # Pack to 4-byte (32-bit) structure
-        value = struct.unpack(">i", adc)[0]  # Unpack as 4-byte signed integer
-        self._adc_out = value / 128  # Restore to 24-bit signed integer value
+        to be True. The three result registers (ADCO_B2, ADCO_B1, ADCO_B0) are
+        fetched in a single auto-incrementing I2C transaction."""
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._adc_reg, self._adc_buf)
+        adc = self._adc_buf[0] << 16  # [23:16] MSByte
+        adc = adc | (self._adc_buf[1] << 8)  # [15: 8] MidSByte
+        adc = adc | self._adc_buf[2]  # [ 7: 0] LSByte
+        if adc & 0x800000:  # Sign-extend the 24-bit two's complement value
+            adc = adc - 0x1000000
+        self._adc_out = adc
         return self._adc_out
 
-    def reset(self):
+    async def read_async(self):
+        """Awaitable read of the next 24-bit ADC conversion. Yields to other
+        tasks until the ADC data-ready status is True. Returns a signed integer
+        value with 24-bit resolution."""
+        return await self._run_async(self._read_steps())
+
+    def stream(self, samples=None):
+        """Return an asynchronous iterator of raw ADC conversions from the
+        selected channel for use with 'async for'. Provides the specified
+        number of samples or runs indefinitely if samples is None."""
+        return _SampleStream(self, samples)
+
+    def _poll_interval(self):
+        """The data-ready poll interval in seconds. The DRDY pin is read
+        without bus traffic so it is polled on every step; otherwise
+        available() is polled over I2C a few times per conversion period."""
+        if self._drdy is not None:
+            return 0
+        return 1 / (self._conversion_rate * _POLLS_PER_CONVERSION)
+
+    def _read_steps(self):
+        """Wait for and read the next conversion; yields wait times."""
+        while not self.available():
+            yield self._poll_interval()
+        return self.read()
+
+    def _settle_steps(self):
+        """Wait for the analog multiplexer to settle after a channel switch
+        using the selected settling strategy; yields wait times in seconds.
+        Updates the settling counters."""
+        t0 = time.monotonic()
+        conversions = 0
+        if self._settle_mode == "SLEEP":
+            yield self._settle_time  # Conversion rate settling time
+            while not self.available():
+                yield self._poll_interval()
+        elif self._settle_mode == "DISCARD":
+            while conversions < self._settle_discard[self._conversion_rate]:
+                yield from self._read_steps()
+                conversions += 1
+        else:  # CONVERGE
+            tolerance = self._settle_tolerance[self._conversion_rate]
+            # The first conversion may have started before the switch
+            previous = yield from self._read_steps()
+            conversions = 1
+            while conversions < self._settle_limit:
+                value = yield from self._read_steps()
+                conversions += 1
+                if abs(value - previous) <= tolerance:
+                    break
+                previous = value
+        self._settle_switches += 1
+        self._settle_last = conversions
+        self._settle_total += conversions
+        self._settle_duration = time.monotonic() - t0
+
+    @staticmethod
+    def _run(steps):
+        """Run a step sequence, sleeping for each yielded wait time in
+        seconds. Returns the step sequence result."""
+        try:
+            while True:
+                time.sleep(next(steps))
+        except StopIteration as result:
+            return result.value
+
+    @staticmethod
+    async def _run_async(steps):
+        """Run a step sequence, yielding to other tasks for each yielded wait
+        time in seconds. Returns the step sequence result."""
+        import asyncio
+
+        try:
+            while True:
+                await asyncio.sleep(next(steps))
+        except StopIteration as result:
+            return result.value
+
+    def _shadow_read(self, register):
+        """Return the shadowed register value, reading the device only if the
+        register is not cached. Write-only registers read as zero until
+        written."""
+        if register in self._shadow:
+            return self._shadow[register]
+        if register in _WRITE_ONLY:
+            return 0x00
+        self._reg_buf[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._reg_buf, self._reg_buf, out_end=1, in_start=1)
+        value = self._reg_buf[1] & ~_VOLATILE.get(register, 0x00)
+        self._shadow[register] = value
+        return value
+
+    def _shadow_write(self, register, value):
+        """Write the register value to the device if it differs from the
+        shadowed value. Volatile status and start bits are not cached."""
+        if self._shadow.get(register) == value:
+            return
+        if self._dirty is not None:
+            self._shadow[register] = value
+            if register not in self._dirty:
+                self._dirty.append(register)
+            return
+        self._reg_buf[0] = register
+        self._reg_buf[1] = value
+        with self.i2c_device as i2c:
+            i2c.write(self._reg_buf)
+        self._shadow[register] = value & ~_VOLATILE.get(register, 0x00)
+
+    def _flush(self):
+        """Write the deferred register values and end batching. Consecutive
+        register addresses are written in a single auto-incrementing
+        transaction."""
+        registers = sorted(self._dirty)
+        self._dirty = None
+        index = 0
+        while index < len(registers):
+            last = index
+            while (
+                last + 1 < len(registers) and registers[last + 1] == registers[last] + 1
+            ):
+                last += 1
+            buf = bytearray(last - index + 2)
+            buf[0] = registers[index]
+            for offset in range(last - index + 1):
+                buf[offset + 1] = self._shadow[registers[index + offset]]
+            with self.i2c_device as i2c:
+                i2c.write(buf)
+            index = last + 1
+
+    def sync(self):
+        """Refresh the register shadow cache from the device. Use if the device
+        registers may have been changed outside of the driver."""
+        self.invalidate()
+        for register in _SHADOWED:
+            if register not in _WRITE_ONLY:
+                self._shadow_read(register)
+
+    def invalidate(self):
+        """Discard the register shadow cache. Registers are read from the
+        device on next use."""
+        self._shadow.clear()
+
+    def reset(self, timeout=1.0):
         """Resets all device registers and enables digital system power.
         Returns the power ready status bit value: True when system is ready;
-        False when system not ready for use."""
+        False when system not ready within timeout seconds."""
+        return self._run(self._reset_steps(timeout))
+
+    async def reset_async(self, timeout=1.0):
+        """Awaitable reset of all device registers. Returns the power ready
+        status bit value."""
+        return await self._run_async(self._reset_steps(timeout))
+
+    def _reset_steps(self, timeout=1.0):
+        """Reset the device registers; yields wait times in seconds. Polls the
+        power ready status bit rather than waiting a fixed time. Gives up
+        after timeout seconds."""
         self._pu_reg_reset = True  # Reset all registers
-        time.sleep(0.100)  # Wait 100ms; 10ms minimum
+        yield 0.010  # Wait 10ms minimum
+        self.invalidate()  # Register contents restored to chip defaults
+        self._shadow.update(_RESET_VALUES)
         self._pu_reg_reset = False
         self._pu_digital = True
-        time.sleep(0.750)  # Wait 750ms; 400ms minimum
-        return self._pu_ready
+        t0 = time.monotonic()
+        while not self._pu_ready:
+            if time.monotonic() - t0 > timeout:
+                return False
+            yield 0.001  # Poll every 1ms
+        return True
 
     def calibrate(self, mode="INTERNAL"):
         """Perform the calibration procedure. Valid calibration modes
         are 'INTERNAL', 'OFFSET', and 'GAIN'. True if successful."""
+        return self._run(self._calibrate_steps(mode))
+
+    async def calibrate_async(self, mode="INTERNAL"):
+        """Awaitable calibration procedure. Yields to other tasks while the
+        calibration is in progress. True if successful."""
+        return await self._run_async(self._calibrate_steps(mode))
+
+    def _calibrate_steps(self, mode):
+        """Calibrate and wait for completion; yields wait times in seconds."""
+        self.start_calibration(mode)
+        while self.calibration_pending():
+            yield 0.010  # 10ms
+        return self.calibration_result()
+
+    def start_calibration(self, mode="INTERNAL"):
+        """Start the calibration procedure and return without waiting for
+        completion. Valid calibration modes are 'INTERNAL', 'OFFSET', and
+        'GAIN'. Poll calibration_pending() until False, then read
+        calibration_result(). Do not change channels while pending."""
         if not mode in dir(CalibrationMode):
             raise ValueError("Invalid Calibration Mode")
         self._calib_mode = mode
@@ -300,7 +732,61 @@ class NAU7802:
             self._c2_cal_mode = CalibrationMode.OFFSET
         elif self._calib_mode == "GAIN":  # External PGA full-scale gain setting
             self._c2_cal_mode = CalibrationMode.GAIN
+        self._calib_result = None
+        self._calib_pending = True
         self._c2_cal_start = True
-        while self._c2_cal_start:
-            time.sleep(0.010)  # 10ms
-        return not self._c2_cal_error
+
+    def calibration_pending(self):
+        """True while a calibration started by start_calibration() is in
+        progress; False when complete or if no calibration was started."""
+        if not self._calib_pending:
+            return False
+        if self._c2_cal_active:
+            return True
+        self._calib_pending = False
+        self._calib_result = not self._c2_cal_error
+        return False
+
+    def save_calibration(self, channel=None):
+        """Read the offset and gain calibration registers for the channel
+        (defaults to the selected channel). Returns a tuple of the raw 24-bit
+        offset and 32-bit gain calibration register values."""
+        if channel is None:
+            channel = self.channel
+        buf = bytearray(8)  # Register address; OCAL[23:0] and GCAL[31:0]
+        buf[0] = self._calibration_register(channel)
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
+        offset = (buf[1] << 16) | (buf[2] << 8) | buf[3]
+        gain = (buf[4] << 24) | (buf[5] << 16) | (buf[6] << 8) | buf[7]
+        return offset, gain
+
+    def load_calibration(self, calibration, channel=None):
+        """Write the offset and gain calibration registers for the channel
+        (defaults to the selected channel). calibration is a tuple of raw
+        offset and gain values as returned by save_calibration(). Restoring a
+        stored calibration replaces calibrate() at start-up."""
+        if channel is None:
+            channel = self.channel
+        offset, gain = calibration
+        buf = bytearray(8)
+        buf[0] = self._calibration_register(channel)
+        buf[1:4] = (offset & 0xFFFFFF).to_bytes(3, "big")
+        buf[4:8] = (gain & 0xFFFFFFFF).to_bytes(4, "big")
+        with self.i2c_device as i2c:
+            i2c.write(buf)
+
+    def _calibration_register(self, channel):
+        """The first calibration register address for the channel. The
+        offset and gain registers are contiguous."""
+        if channel == 1:
+            return _OCAL1_B2
+        if channel == 2 and self._act_channels == 2:
+            return _OCAL2_B2
+        raise ValueError("Invalid Channel Number")
+
+    def calibration_result(self):
+        """The result of the last completed calibration: True if successful,
+        False if the calibration failed, or None if no calibration has
+        completed."""
+        return self._calib_result
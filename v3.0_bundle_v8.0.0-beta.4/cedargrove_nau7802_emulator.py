@@ -0,0 +1,323 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# cedargrove_nau7802_emulator.py  2026-10-18 v1.0  Cedar Grove Maker Studios
+
+
+"""
+`cedargrove_nau7802_emulator`
+================================================================================
+
+A register-level NAU7802 24-bit ADC emulator and an I2C bus stand-in. Used to
+exercise the cedargrove_nau7802 driver's register code without a connected
+NAU7802 FeatherWing. The EmulatedI2C bus implements the busio.I2C methods used
+by adafruit_bus_device.I2CDevice and counts bus transactions and bytes.
+
+Emulated: the register map, register reset, power-up ready, conversion ready
+(CR and the DRDY pin) timed by the selected conversion rate and the conversion
+cycle start (CS) bit, channel select, offset and gain calibration with the
+calibration start (CALS) bit, and the channel calibration registers.
+
+  i2c = EmulatedI2C()
+  emulator = NAU7802Emulator(i2c, address=0x2A)
+  emulator.set_input(1, 215300)
+  nau7802 = NAU7802(i2c, address=0x2A, active_channels=2)
+
+
+* Author(s): JG
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+* CPython 3 with Adafruit's Bus Device library for host-side testing:
+  https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+import time
+
+# Emulated register addresses
+_PU_CTRL = 0x00
+_CTRL1 = 0x01
+_CTRL2 = 0x02
+_OCAL1_B2 = 0x03
+_GCAL1_B3 = 0x06
+_OCAL2_B2 = 0x0A
+_GCAL2_B3 = 0x0D
+_ADCO_B2 = 0x12
+_ADCO_B0 = 0x14
+_ADC = 0x15
+_REV_ID = 0x1F
+
+# Conversion rate in samples per second for each _CTRL2[6:4] setting
+_RATES = {0x0: 10, 0x1: 20, 0x2: 40, 0x3: 80, 0x7: 320}
+_GCAL_UNITY = 0x00800000  # Gain calibration register value for unity gain
+
+
+class _DataReady:
+    """DRDY pin stand-in; value is True when a conversion is ready."""
+
+    def __init__(self, emulator):
+        self._emulator = emulator
+
+    @property
+    def value(self):
+        return self._emulator.conversion_ready
+
+
+class EmulatedI2C:
+    """An I2C bus stand-in for emulated devices. Compatible with
+    adafruit_bus_device.I2CDevice."""
+
+    def __init__(self):
+        self._devices = {}
+        self._locked = False
+        self.reset_counters()
+
+    def attach(self, address, device):
+        """Attach an emulated device at the I2C address."""
+        self._devices[address] = device
+
+    def reset_counters(self):
+        """Clear the transaction and byte counters."""
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    @property
+    def counters(self):
+        """A tuple of the transaction, bytes written, and bytes read counts."""
+        return self.transactions, self.bytes_written, self.bytes_read
+
+    def try_lock(self):
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self):
+        self._locked = False
+
+    def scan(self):
+        return sorted(self._devices)
+
+    def deinit(self):
+        return
+
+    def _device(self, address):
+        if address not in self._devices:
+            raise OSError(19)  # ENODEV; no device at the address
+        return self._devices[address]
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        device = self._device(address)
+        if end is None:
+            end = len(buffer)
+        self.transactions += 1
+        self.bytes_written += end - start
+        device.write(buffer[start:end])
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        device = self._device(address)
+        if end is None:
+            end = len(buffer)
+        self.transactions += 1
+        self.bytes_read += end - start
+        device.read_into(buffer, start, end)
+
+    def writeto_then_readfrom(
+        self,
+        address,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None
+    ):
+        device = self._device(address)
+        if out_end is None:
+            out_end = len(buffer_out)
+        if in_end is None:
+            in_end = len(buffer_in)
+        self.transactions += 1
+        self.bytes_written += out_end - out_start
+        self.bytes_read += in_end - in_start
+        device.write(buffer_out[out_start:out_end])
+        device.read_into(buffer_in, in_start, in_end)
+
+
+class NAU7802Emulator:
+    def __init__(self, i2c_bus, address=0x2A, clock=time.monotonic):
+        """Instantiate the emulated NAU7802 and attach it to the emulated I2C
+        bus.
+
+        :param class i2c_bus: The EmulatedI2C bus.
+        :param integer address: The device I2C address. Defaults to 0x2A.
+        :param function clock: A function returning the time in seconds.
+        Defaults to time.monotonic; inject a virtual clock for simulation.
+        """
+        self._clock = clock
+        self._inputs = {1: 0, 2: 0}  # Raw input counts per channel
+        self.drdy = _DataReady(self)
+        self._reset_registers()
+        i2c_bus.attach(address, self)
+
+    def _reset_registers(self):
+        self._regs = bytearray(0x20)
+        self._regs[_REV_ID] = 0x0F
+        for reg in (_GCAL1_B3, _GCAL2_B3):
+            self._regs[reg : reg + 4] = _GCAL_UNITY.to_bytes(4, "big")
+        self._pointer = 0
+        self._adc_out = 0
+        self._ready = False
+        self._next_conversion = None
+        self._cal_done = None
+        self.conversions = 0  # Number of completed conversions
+
+    def set_input(self, channel, counts):
+        """Set the raw analog input of the channel in ADC counts. counts is an
+        integer or a function of the time in seconds returning an integer."""
+        self._inputs[channel] = counts
+
+    @property
+    def channel(self):
+        """The selected channel number (1 or 2)."""
+        return 2 if self._regs[_CTRL2] & 0x80 else 1
+
+    @property
+    def conversion_rate(self):
+        """The selected conversion rate in samples per second."""
+        return _RATES.get((self._regs[_CTRL2] >> 4) & 0x7, 10)
+
+    @property
+    def conversion_ready(self):
+        """The conversion ready (CR) status."""
+        self._update()
+        return self._ready
+
+    def _input(self, channel):
+        counts = self._inputs[channel]
+        if callable(counts):
+            counts = counts(self._clock())
+        return int(counts)
+
+    def _running(self):
+        # Digital and analog powered and conversion cycle started
+        return self._regs[_PU_CTRL] & 0x16 == 0x16
+
+    def _cal_register(self, channel):
+        return _OCAL1_B2 if channel == 1 else _OCAL2_B2
+
+    def _convert(self):
+        """Latch a conversion of the selected channel with the channel's offset
+        and gain calibration applied."""
+        reg = self._cal_register(self.channel)
+        offset = int.from_bytes(self._regs[reg : reg + 3], "big")
+        if offset & 0x800000:
+            offset -= 0x1000000
+        gain = int.from_bytes(self._regs[reg + 3 : reg + 7], "big")
+        value = (self._input(self.channel) - offset) * gain // _GCAL_UNITY
+        self._adc_out = max(-0x800000, min(0x7FFFFF, value))
+        self._ready = True
+        self.conversions += 1
+
+    def _calibrate(self):
+        """Complete the calibration selected by CALMOD for the channel."""
+        mode = self._regs[_CTRL2] & 0x03
+        reg = self._cal_register(self.channel)
+        if mode == 0x2:  # Offset Calibration System
+            offset = self._input(self.channel) & 0xFFFFFF
+            self._regs[reg : reg + 3] = offset.to_bytes(3, "big")
+        elif mode == 0x3:  # Gain Calibration System
+            offset = int.from_bytes(self._regs[reg : reg + 3], "big")
+            if offset & 0x800000:
+                offset -= 0x1000000
+            span = self._input(self.channel) - offset
+            if span <= 0:
+                self._regs[_CTRL2] |= 0x08  # CAL_ERR
+            else:
+                gain = min(0xFFFFFFFF, 0x7FFFFF * _GCAL_UNITY // span)
+                self._regs[reg + 3 : reg + 7] = gain.to_bytes(4, "big")
+        self._regs[_CTRL2] &= ~0x04  # Clear CALS
+
+    def _update(self):
+        """Advance the conversion and calibration state to the current time."""
+        now = self._clock()
+        if self._cal_done is not None and now >= self._cal_done:
+            self._cal_done = None
+            self._calibrate()
+        if not self._running():
+            self._next_conversion = None
+            return
+        period = 1 / self.conversion_rate
+        if self._next_conversion is None:
+            self._next_conversion = now + period
+        if now >= self._next_conversion:
+            self._convert()
+            missed = int((now - self._next_conversion) / period)
+            self._next_conversion += (missed + 1) * period
+
+    def _read_register(self, reg):
+        if reg == _PU_CTRL:
+            value = self._regs[_PU_CTRL] & ~0x28
+            if value & 0x02:
+                value |= 0x08  # PUR; digital power is up
+            if self._ready:
+                value |= 0x20  # CR
+            return value
+        if _ADCO_B2 <= reg <= _ADCO_B0:
+            shift = (_ADCO_B0 - reg) * 8
+            if reg == _ADCO_B0:
+                self._ready = False  # Reading the result clears CR
+            return ((self._adc_out & 0xFFFFFF) >> shift) & 0xFF
+        if reg == _ADC:
+            return 0x00  # OTP_B1; the ADC control register is write-only
+        return self._regs[reg & 0x1F]
+
+    def _write_register(self, reg, value):
+        if reg == _PU_CTRL:
+            if value & 0x01:  # RR; register reset
+                self._reset_registers()
+                self._regs[_PU_CTRL] = 0x01
+                return
+            if value & 0x10 and not self._regs[_PU_CTRL] & 0x10:
+                self._next_conversion = None  # CS rising edge restarts cycle
+            self._regs[_PU_CTRL] = value & ~0x28
+            return
+        if reg == _CTRL2:
+            self._regs[_CTRL2] = (self._regs[_CTRL2] & 0x0C) | (value & ~0x0C)
+            if value & 0x04:  # CALS; start calibration
+                self._regs[_CTRL2] = (self._regs[_CTRL2] & ~0x08) | 0x04
+                self._cal_done = self._clock() + 2 / self.conversion_rate
+            return
+        if reg in (_ADCO_B2, _ADCO_B2 + 1, _ADCO_B0, _REV_ID):
+            return  # Read-only
+        self._regs[reg & 0x1F] = value
+
+    def write(self, data):
+        """Handle an I2C write: register pointer followed by data bytes."""
+        self._update()
+        if not data:
+            return  # Address probe
+        self._pointer = data[0]
+        for value in data[1:]:
+            self._write_register(self._pointer, value)
+            self._pointer = (self._pointer + 1) & 0x1F
+
+    def read_into(self, buffer, start, end):
+        """Handle an I2C read from the register pointer, auto-incrementing."""
+        self._update()
+        for index in range(start, end):
+            buffer[index] = self._read_register(self._pointer)
+            self._pointer = (self._pointer + 1) & 0x1F
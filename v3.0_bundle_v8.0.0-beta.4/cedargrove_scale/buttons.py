@@ -49,6 +49,9 @@ class ScaleButtons(displayio.Group):
 
         self._debug = debug
         self._timeout = timeout
+        self._held = None  # Button touched but not yet released
+        self._held_time = 0
+        self._timeout_beep = False
 
         if touchscreen:
             self._ts = touchscreen
@@ -277,3 +280,31 @@ class ScaleButtons(displayio.Group):
                             timeout_beep = True
                     self._button.selected = False
         return button_pressed, hold_time
+
+    def poll_buttons(self):
+        """Non-blocking version of read_buttons() for use in a periodic task.
+        Returns the button name and hold time in seconds once a touched
+        button is released; None and 0 otherwise."""
+        touch = self._ts.touch_point
+        if self._held is None:
+            if touch:
+                for button in self._buttons:
+                    if button.contains(touch):
+                        button.selected = True
+                        tone(board.A0, 1319, 0.030)  # E6
+                        self._held = button
+                        self._held_time = time.monotonic()
+                        self._timeout_beep = False
+                        break
+            return None, 0
+
+        hold_time = time.monotonic() - self._held_time
+        if touch:
+            if hold_time >= self._timeout and not self._timeout_beep:
+                tone(board.A0, 1175, 0.030)  # D6
+                self._timeout_beep = True
+            return None, 0
+        button = self._held
+        button.selected = False
+        self._held = None
+        return button.name, hold_time
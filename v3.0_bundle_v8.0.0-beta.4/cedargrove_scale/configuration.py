@@ -37,13 +37,36 @@ import foamyguy_nvm_helper as nvm_helper
 class LoadCellConfig:
     """Load cell measurement configuration."""
 
-    SAMPLE_AVG = 1  # Number of samples to average per measurement
+    DWELL = 8  # Number of samples acquired from a channel before switching
     PGA_GAIN = 128  # Default gain for internal PGA
+    CONVERSION_RATE = 10  # ADC samples per second; 10, 20, 40, 80, or 320
+    SETTLE_MODE = "DISCARD"  # Channel switch settling; SLEEP, DISCARD, CONVERGE
+
+    # Sample filter stages per channel; MOVING_AVERAGE, ADAPTIVE, MEDIAN,
+    #   EXPONENTIAL, KALMAN. ADAPTIVE parameters: min window, max window, and
+    #   the raw count change that shrinks the window to track a moving load.
+    FILTER_1 = (("MEDIAN", 3), ("ADAPTIVE", 1, 16, 1024))
+    FILTER_2 = (("MEDIAN", 3), ("ADAPTIVE", 1, 16, 1024))
+
+    # Settled reading detection
+    STABLE_WINDOW = 4  # Number of filtered samples in the stability window
+    STABLE_BAND_GR = 0.2  # Stability band in grams
+    STABLE_TIME = 0.5  # Minimum time within the stability band in seconds
+
+    # Automatic zero tracking of stable readings near zero
+    ZERO_TRACK = True  # Enable automatic zero tracking
+    ZERO_TRACK_BAND_GR = 0.2  # Tracking band around zero in grams
+    ZERO_TRACK_RATE_GR = 0.05  # Maximum zero change in grams per second
+    ZERO_TRACK_LIMIT_GR = 2.0  # Maximum total zero change in grams
 
     # Load cell calibration ratio
     CALIB_RATIO_1 = Defaults.LOADCELL_1_CALIBRATION
     CALIB_RATIO_2 = Defaults.LOADCELL_2_CALIBRATION
 
+    # Load cell multi-point calibration; replaces the ratio if not None
+    CALIB_POINTS_1 = Defaults.LOADCELL_1_CALIBRATION_POINTS
+    CALIB_POINTS_2 = Defaults.LOADCELL_2_CALIBRATION_POINTS
+
 
 class Display:
     """Instantiate the display and touchscreen as specified by the DISPLAY_NAME
@@ -153,10 +176,24 @@ class Display:
         except:
             print("** WARNING: Display brightness not adjustable")
 
+    @property
+    def auto_refresh(self):
+        return Display.display.auto_refresh
+
+    @auto_refresh.setter
+    def auto_refresh(self, enable):
+        Display.display.auto_refresh = enable
+
     def show(self, group):
         Display.display.show(group)
         return
 
+    def refresh(self):
+        """Draw pending display changes now rather than at the next automatic
+        refresh."""
+        Display.display.refresh()
+        return
+
     def screen_to_rect(self, width_factor=0, height_factor=0):
         """Convert normalized screen position input (0.0 to 1.0) to the display's
         rectangular pixel position."""
@@ -191,18 +228,41 @@ class Colors:
 
 
 class NVM:
-    """Store settings in nonvolatile memory (NVM)."""
+    """Store settings and load cell calibration in nonvolatile memory (NVM)."""
 
     def __init__(self):
-        pass
+        self._settings = None
+        # NAU7802 offset and gain calibration register values; channel 1, 2
+        self._calibration = [None, None, None, None]
 
     def write_settings(self, list=[None, None, None, None, False, False, False, False]):
         """Write settings data to NVM.
-        Order of values and enables is alarm_1, alarm_2, tare_1, tare_2."""
-        list.insert(0, "")
-        nvm_helper.save_data(list, test_run=False, verbose=False)
+        Order of values and enables is alarm_1, alarm_2, tare_1, tare_2.
+        Stored load cell calibration values are retained."""
+        self._settings = list[0:8]
+        data = [""] + self._settings + self._calibration
+        nvm_helper.save_data(data, test_run=False, verbose=False)
         return True
 
+    def write_calibration(self, channel, calibration):
+        """Write a channel's NAU7802 offset and gain calibration register
+        values to NVM. calibration is the (offset, gain) tuple provided by
+        the NAU7802 save_calibration method."""
+        if self._settings is None:
+            self.fetch_settings()
+        index = (channel - 1) * 2
+        self._calibration[index : index + 2] = list(calibration)
+        self.write_settings(list=self._settings)
+        return True
+
+    def fetch_calibration(self, channel):
+        """Fetch a channel's stored (offset, gain) calibration tuple. Returns
+        None if no calibration is stored. Call after fetch_settings."""
+        index = (channel - 1) * 2
+        if None in self._calibration[index : index + 2]:
+            return None
+        return tuple(self._calibration[index : index + 2])
+
     def restore_defaults(self):
         """Clear NVM settings data."""
         from scale_defaults import Defaults
@@ -233,8 +293,11 @@ class NVM:
 
         if nvm_data[0] == "":  # If settings valid, first entry in list should be ''
             print("  settings data FOUND")
-            return nvm_data[1:]
+            self._settings = nvm_data[1:9]
+            if len(nvm_data) == 13:  # Calibration values stored after settings
+                self._calibration = nvm_data[9:13]
+            return self._settings
         else:
             print("** WARNING: settings data NOT FOUND")
             self.restore_defaults()
-        return nvm_helper.read_data()[1:]
+        return nvm_helper.read_data()[1:9]
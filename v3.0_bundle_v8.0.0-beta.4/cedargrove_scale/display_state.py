@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`display_state.py`
+================================================================================
+
+The DisplayState class for the dual-channel Scale project.
+cedargrove_scale.display_state.py  2026-10-18 v1.0  Cedar Grove Studios
+
+Dirty-tracking of displayio properties. Each display property, such as a
+label's text or color, a sprite TileGrid's tile index, or a dial marker
+position, is registered once by name. set() compares the desired value with
+the value last written and writes the property only when it has changed, so
+unchanged labels, sprites, and markers are not redrawn. A property that is
+written elsewhere, for example by Labels.flash_status(), must be invalidated
+so that the next set() writes it again.
+
+  ui = DisplayState()
+  ui.add("chan_1_text", labels.chan_1_value, "text")
+  ui.add("tare_1_icon", panel.tare_1_icon)  # TileGrid tile index
+  ui.set("chan_1_text", format_mass(chan_1_mass_mg))
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+_UNKNOWN = object()  # The rendered value of a property is not known
+
+
+class DisplayState:
+    def __init__(self):
+        """Instantiate an empty display state."""
+        self._targets = {}
+        self._rendered = {}
+        self.reset_stats()
+
+    @property
+    def stats(self):
+        """A tuple of the number of property writes and skipped unchanged
+        writes since the last reset_stats()."""
+        return (self.writes, self.skips)
+
+    def reset_stats(self):
+        """Clear the write counters."""
+        self.writes = 0
+        self.skips = 0
+
+    def add(self, name, target, attribute=None):
+        """Register a display property. The first set() always writes it.
+
+        :param str name: The property name used by set().
+        :param target: The displayio object, such as a Label, TileGrid, or the
+        Scale dial widget.
+        :param str attribute: The attribute of the target to write. Defaults
+        to None, which writes tile index 0 of a sprite TileGrid.
+        """
+        self._targets[name] = (target, attribute)
+        self._rendered[name] = _UNKNOWN
+
+    def get(self, name):
+        """The value last written to the property or None if not known."""
+        value = self._rendered[name]
+        if value is _UNKNOWN:
+            return None
+        return value
+
+    def set(self, name, value):
+        """Write the property if the value differs from the value last
+        written. Returns True if the property was written."""
+        if self._rendered[name] == value:
+            self.skips += 1
+            return False
+        target, attribute = self._targets[name]
+        if attribute is None:
+            target[0] = value
+        else:
+            setattr(target, attribute, value)
+        self._rendered[name] = value
+        self.writes += 1
+        return True
+
+    def invalidate(self, *names):
+        """Forget the rendered values of the named properties, or of all
+        properties if no names are given, so that the next set() writes
+        them. Use after a property is written outside of set()."""
+        if not names:
+            names = self._targets
+        for name in names:
+            self._rendered[name] = _UNKNOWN
@@ -0,0 +1,412 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`filters.py`
+================================================================================
+
+Streaming sample filters for the dual-channel Scale project.
+cedargrove_scale.filters.py  2026-10-18 v1.0  Cedar Grove Studios
+
+Each filter stage accepts one raw sample per update() call and returns the
+filtered value immediately, so a low-noise result is available after every
+sample rather than once per block of samples. Stage buffers are allocated when
+the stage is instantiated and stage state is kept in fixed-point integers, so
+update() does not allocate on the heap. Stages are combined with FilterChain,
+typically one chain per load cell channel:
+
+  filters = {1: FilterChain(Median(3), Kalman()), 2: FilterChain(Median(3))}
+  value = filters[1].update(nau7802.read())
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+from array import array
+
+_WEIGHT_BITS = 12  # Fraction bits of the Exponential alpha and the Kalman gain
+_STATE_BITS = 4  # Fraction bits of the Exponential and Kalman state
+_MAX_VARIANCE = 1 << 17  # Keeps Kalman products within the small-integer range
+
+
+def _weigh(difference, weight):
+    """Multiply a fixed-point state difference by a fixed-point weight."""
+    # Split the difference so each product stays a small integer
+    high = difference >> _WEIGHT_BITS
+    low = difference & ((1 << _WEIGHT_BITS) - 1)
+    return high * weight + ((low * weight) >> _WEIGHT_BITS)
+
+
+class MovingAverage:
+    def __init__(self, window=8):
+        """Instantiate a moving average of the most recent samples. The
+        running sum is adjusted as each sample enters and leaves the window.
+
+        :param integer window: The number of samples averaged. Defaults to 8.
+        """
+        if window < 1:
+            raise ValueError("Window must be 1 or greater.")
+        self._window = window
+        self._buffer = array("i", [0] * window)
+        self.reset()
+
+    @property
+    def window(self):
+        """The number of samples averaged."""
+        return self._window
+
+    @property
+    def value(self):
+        """The most recent filtered value or None if no samples were
+        filtered."""
+        return self._value
+
+    def reset(self):
+        """Discard the filter history."""
+        self._head = 0
+        self._count = 0
+        self._sum = 0
+        self._value = None
+
+    def update(self, sample):
+        """Add a sample and return the average of the samples in the
+        window."""
+        if self._count == self._window:
+            self._sum -= self._buffer[self._head]
+        else:
+            self._count += 1
+        self._buffer[self._head] = sample
+        self._sum += sample
+        self._head = (self._head + 1) % self._window
+        # Round to the nearest integer
+        self._value = (self._sum + self._count // 2) // self._count
+        return self._value
+
+
+class AdaptiveAverage:
+    def __init__(self, min_window=1, max_window=32, threshold=1024):
+        """Instantiate a moving average with a window that adapts to the rate
+        of change of the samples. When a sample differs from the average by
+        more than the threshold the window shrinks to min_window, tracking a
+        changing load closely. The window then grows by one sample per update
+        up to max_window while the load is steady, reducing noise.
+
+        :param integer min_window: The smallest window. Defaults to 1.
+        :param integer max_window: The largest window. Defaults to 32.
+        :param integer threshold: The change in raw counts from the average
+        that shrinks the window. Defaults to 1024.
+        """
+        if not 1 <= min_window <= max_window:
+            raise ValueError("Windows must be 1 or greater; min <= max.")
+        self._min_window = min_window
+        self._max_window = max_window
+        self.threshold = threshold
+        self._buffer = array("i", [0] * max_window)
+        self.reset()
+
+    @property
+    def window(self):
+        """The number of samples in the current average."""
+        return self._length
+
+    @property
+    def window_stats(self):
+        """Window statistics since the last reset_stats(): a tuple of the
+        current, smallest, largest, and mean window sizes and the number of
+        times the window was shrunk."""
+        if self._updates == 0:
+            return (self._length, 0, 0, 0, self._shrinks)
+        return (
+            self._length,
+            self._smallest,
+            self._largest,
+            self._window_sum / self._updates,
+            self._shrinks,
+        )
+
+    @property
+    def value(self):
+        """The most recent filtered value or None if no samples were
+        filtered."""
+        return self._value
+
+    def reset_stats(self):
+        """Clear the window statistics."""
+        self._updates = 0
+        self._window_sum = 0
+        self._smallest = self._max_window
+        self._largest = 0
+        self._shrinks = 0
+
+    def reset(self):
+        """Discard the filter history and window statistics."""
+        self._head = 0
+        self._length = 0  # Number of samples in the running sum
+        self._window = self._min_window  # Target window size
+        self._sum = 0
+        self._value = None
+        self.reset_stats()
+
+    def update(self, sample):
+        """Add a sample, adapt the window, and return the average of the
+        samples in the window."""
+        shrink = self._value is not None and abs(sample - self._value) > self.threshold
+        if self._length == self._max_window:
+            self._sum -= self._buffer[self._head]  # Oldest leaves the buffer
+            self._length -= 1
+        self._buffer[self._head] = sample
+        self._head = (self._head + 1) % self._max_window
+        self._sum += sample
+        self._length += 1
+
+        if shrink:
+            self._window = self._min_window
+            self._shrinks += 1
+        elif self._window < self._max_window:
+            self._window += 1
+        # Each sample leaves the sum once, so this is O(1) per sample on average
+        while self._length > self._window:
+            self._sum -= self._buffer[(self._head - self._length) % self._max_window]
+            self._length -= 1
+
+        self._updates += 1
+        self._window_sum += self._length
+        self._smallest = min(self._smallest, self._length)
+        self._largest = max(self._largest, self._length)
+        self._value = (self._sum + self._length // 2) // self._length
+        return self._value
+
+
+class Median:
+    def __init__(self, k=5):
+        """Instantiate a median of the most recent k samples. Removes single
+        sample spikes. A sorted copy of the window is kept up to date as each
+        sample enters and leaves the window.
+
+        :param integer k: The number of samples in the window. Defaults to 5.
+        """
+        if k < 1:
+            raise ValueError("k must be 1 or greater.")
+        self._k = k
+        self._buffer = array("i", [0] * k)
+        self._sorted = array("i", [0] * k)
+        self.reset()
+
+    @property
+    def k(self):
+        """The number of samples in the window."""
+        return self._k
+
+    @property
+    def value(self):
+        """The most recent filtered value or None if no samples were
+        filtered."""
+        return self._value
+
+    def reset(self):
+        """Discard the filter history."""
+        self._head = 0
+        self._count = 0
+        self._value = None
+
+    def update(self, sample):
+        """Add a sample and return the median of the samples in the window."""
+        ordered = self._sorted
+        count = self._count
+        if count == self._k:
+            # Remove the oldest sample from the sorted window
+            index = 0
+            oldest = self._buffer[self._head]
+            while ordered[index] != oldest:
+                index += 1
+            while index < count - 1:
+                ordered[index] = ordered[index + 1]
+                index += 1
+            count -= 1
+        # Insert the new sample into the sorted window
+        index = count
+        while index > 0 and ordered[index - 1] > sample:
+            ordered[index] = ordered[index - 1]
+            index -= 1
+        ordered[index] = sample
+        count += 1
+
+        self._count = count
+        self._buffer[self._head] = sample
+        self._head = (self._head + 1) % self._k
+        if count % 2:
+            self._value = ordered[count // 2]
+        else:
+            self._value = (ordered[count // 2 - 1] + ordered[count // 2]) // 2
+        return self._value
+
+
+class Exponential:
+    def __init__(self, alpha=0.25):
+        """Instantiate an exponential moving average.
+
+        :param float alpha: The weight of each new sample, from 0.0 (no
+        change) to 1.0 (no filtering). Defaults to 0.25.
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("Alpha must be greater than 0.0 and no more than 1.0.")
+        self._alpha = alpha
+        self._weight = max(round(alpha * (1 << _WEIGHT_BITS)), 1)
+        self.reset()
+
+    @property
+    def alpha(self):
+        """The weight of each new sample."""
+        return self._alpha
+
+    @property
+    def value(self):
+        """The most recent filtered value or None if no samples were
+        filtered."""
+        return self._value
+
+    def reset(self):
+        """Discard the filter history."""
+        self._state = None
+        self._value = None
+
+    def update(self, sample):
+        """Add a sample and return the exponential moving average."""
+        sample <<= _STATE_BITS
+        if self._state is None:
+            self._state = sample
+        else:
+            self._state += _weigh(sample - self._state, self._weight)
+        self._value = (self._state + (1 << (_STATE_BITS - 1))) >> _STATE_BITS
+        return self._value
+
+
+class Kalman:
+    def __init__(self, measurement_noise=1600, process_noise=16):
+        """Instantiate a one-dimensional Kalman filter for a slowly changing
+        load. The filter weights each sample by the estimate's uncertainty, so
+        it responds quickly after a reset and smooths heavily once settled.
+
+        :param integer measurement_noise: The sample noise variance in raw
+        counts squared. Defaults to 1600 (40 counts standard deviation).
+        :param integer process_noise: The expected load change variance
+        between samples in raw counts squared. Defaults to 16. The sum of the
+        variances must be less than 131072.
+        """
+        if measurement_noise < 1 or process_noise < 0:
+            raise ValueError("Noise variances must be positive.")
+        if measurement_noise + process_noise >= _MAX_VARIANCE:
+            raise ValueError("Noise variances must total less than 131072.")
+        self._r = round(measurement_noise)
+        self._q = round(process_noise)
+        self.reset()
+
+    @property
+    def value(self):
+        """The most recent filtered value or None if no samples were
+        filtered."""
+        return self._value
+
+    @property
+    def variance(self):
+        """The estimate variance in raw counts squared or None if no samples
+        were filtered."""
+        return self._p
+
+    def reset(self):
+        """Discard the filter history."""
+        self._state = None
+        self._p = None
+        self._value = None
+
+    def update(self, sample):
+        """Add a sample and return the filtered estimate."""
+        sample <<= _STATE_BITS
+        if self._state is None:
+            self._state = sample
+            self._p = self._r
+        else:
+            # The variance stays below _MAX_VARIANCE, so the gain and the
+            # updated variance are small integers
+            p = self._p + self._q
+            gain = ((p << _WEIGHT_BITS) + (p + self._r) // 2) // (p + self._r)
+            self._state += _weigh(sample - self._state, gain)
+            self._p = (
+                p * ((1 << _WEIGHT_BITS) - gain) + (1 << (_WEIGHT_BITS - 1))
+            ) >> _WEIGHT_BITS
+        self._value = (self._state + (1 << (_STATE_BITS - 1))) >> _STATE_BITS
+        return self._value
+
+
+_FILTERS = {
+    "MOVING_AVERAGE": MovingAverage,
+    "ADAPTIVE": AdaptiveAverage,
+    "MEDIAN": Median,
+    "EXPONENTIAL": Exponential,
+    "KALMAN": Kalman,
+}
+
+
+class FilterChain:
+    def __init__(self, *stages):
+        """Instantiate a sequence of filter stages. Each sample is passed
+        through the stages in order. A chain without stages returns samples
+        unchanged.
+
+        :param stages: The filter stage instances."""
+        self._stages = stages
+        self._value = None
+
+    @classmethod
+    def from_spec(cls, spec):
+        """Instantiate a chain from a specification such as the LoadCellConfig
+        FILTER settings: a sequence of tuples of a stage name followed by the
+        stage parameters. Valid stage names are 'MOVING_AVERAGE', 'ADAPTIVE',
+        'MEDIAN', 'EXPONENTIAL', and 'KALMAN'.
+
+          FilterChain.from_spec((("MEDIAN", 3), ("EXPONENTIAL", 0.5)))
+        """
+        stages = []
+        for stage in spec:
+            if stage[0] not in _FILTERS:
+                raise ValueError("Invalid Filter Stage")
+            stages.append(_FILTERS[stage[0]](*stage[1:]))
+        return cls(*stages)
+
+    @property
+    def stages(self):
+        """The filter stage instances."""
+        return self._stages
+
+    @property
+    def value(self):
+        """The most recent filtered value or None if no samples were
+        filtered."""
+        return self._value
+
+    def reset(self):
+        """Discard the filter history of all stages. Use after a zero
+        calibration or any other step change of the raw samples."""
+        for stage in self._stages:
+            stage.reset()
+        self._value = None
+
+    def update(self, sample):
+        """Pass a sample through the filter stages and return the filtered
+        value."""
+        for stage in self._stages:
+            sample = stage.update(sample)
+        self._value = sample
+        return sample
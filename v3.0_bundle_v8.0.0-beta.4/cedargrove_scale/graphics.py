@@ -145,8 +145,10 @@ class Labels(displayio.Group):
         self.status_label.text = " "
         self.status_label.text = text
         self.status_label.color = Colors.YELLOW
+        self._display.refresh()  # Show now if automatic refresh is off
         time.sleep(duration)
         self.status_label.color = Colors.BLACK
+        self._display.refresh()
         time.sleep(duration)
         self.status_label.text = " "
         return
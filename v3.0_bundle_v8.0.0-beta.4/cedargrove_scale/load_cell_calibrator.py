@@ -7,12 +7,22 @@ import displayio
 import time
 
 from cedargrove_nau7802 import NAU7802
+from cedargrove_scale.filters import MovingAverage
+from scale_defaults import Defaults
 
-SAMPLE_AVG = 1000  # Number of sample values to average
+SAMPLE_AVG = 1000  # Number of sample values in the moving average
+READ_SAMPLES = 10  # Number of samples read per channel per display update
 DEFAULT_GAIN = 128  # Default gain for internal PGA
 
-# Instantiate 24-bit load sensor ADC
-nau7802 = NAU7802(board.I2C(), address=0x2A, active_channels=2)
+# Instantiate 24-bit load sensor ADC; data-ready from the DRDY pin if connected
+if Defaults.NAU7802_DRDY_PIN:
+    drdy_pin = getattr(board, Defaults.NAU7802_DRDY_PIN)
+else:
+    drdy_pin = None
+nau7802 = NAU7802(board.I2C(), address=0x2A, active_channels=2, drdy_pin=drdy_pin)
+
+# Instantiate a moving average filter for each channel
+filters = {1: MovingAverage(SAMPLE_AVG), 2: MovingAverage(SAMPLE_AVG)}
 
 
 def zero_channel():
@@ -27,23 +37,26 @@ def zero_channel():
         "channel %1d calibrate.OFFSET:   %5s"
         % (nau7802.channel, nau7802.calibrate("OFFSET"))
     )
+    filters[nau7802.channel].reset()
     zero_offset = read(100)  # Read average of 100 samples to establish zero offset
     print("...channel zeroed")
     return zero_offset
 
 
-def read(samples=100):
-    # Read and average consecutive raw sample values; return average raw value
-    sum = 0
+def read(samples=READ_SAMPLES):
+    # Read consecutive raw sample values through the channel's moving average
+    # filter; return the moving average raw value
     for i in range(0, samples):
-        if nau7802.available:
-            sum = sum + nau7802.read()
-    return int(sum / samples)
+        while not nau7802.available():
+            pass
+        value = filters[nau7802.channel].update(nau7802.read())
+    return value
 
 
 # Instantiate and calibrate load cell inputs
 print("*** Instantiate and calibrate load cells")
-print("    enable NAU7802 digital and analog power: %5s" % (nau7802.enable(True)))
+# Digital and analog power were enabled when the NAU7802 was instantiated
+print("    NAU7802 startup time: %5.3f sec" % nau7802.startup_time)
 
 nau7802.gain = DEFAULT_GAIN  # Use default gain
 nau7802.channel = 1
@@ -53,6 +66,7 @@ zero = zero_channel()  # Calibrate and get raw zero offset value
 
 print("GAIN:", DEFAULT_GAIN)
 print("Place the calibration weight on the load cell")
+print("For a multi-point calibration, record the raw value of each weight")
 print("To re-zero the load cells, remove all weights and press reset")
 
 ### Main loop: Read load cells and display raw values
@@ -60,14 +74,14 @@ print("To re-zero the load cells, remove all weights and press reset")
 while True:
     print("=====")
     nau7802.channel = 1
-    value = read(SAMPLE_AVG)
+    value = read()
     print(
         "CHAN_%1.0f RAW VALUE: %7.0f  Percent of full-scale at gain x%3.0f : %3.2f: "
         % (nau7802.channel, value, DEFAULT_GAIN, (value / ((2**23) - 1)) * 100)
     )
 
     nau7802.channel = 2
-    value = read(SAMPLE_AVG)
+    value = read()
     print(
         "CHAN_%1.0f RAW VALUE: %7.0f  Percent of full-scale at gain x%3.0f : %3.2f: "
         % (nau7802.channel, value, DEFAULT_GAIN, (value / ((2**23) - 1)) * 100)
@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`mass.py`
+================================================================================
+
+Fixed-point mass conversion for the dual-channel Scale project.
+cedargrove_scale.mass.py  2026-10-18 v1.0  Cedar Grove Studios
+
+Converts raw ADC counts to integer milligrams with a precomputed fixed-point
+scale factor per channel. Masses, tares, and alarm thresholds are kept as
+integer milligrams so that the measurement loop does not create float objects.
+The intermediate products are kept within the CircuitPython small integer
+range for scale factors below 2**15 (up to 1 milligram per raw count).
+
+  channel_1 = MassConverter(LoadCellConfig.CALIB_RATIO_1)
+  mass_mg = channel_1.to_mg(raw_value) - tare_mg
+  labels.chan_1_value.text = format_mass(mass_mg)
+
+CalibrationCurve provides the same conversion from several reference weights
+as a piecewise-linear curve. Each segment's starting point and fixed-point
+slope are precomputed; a conversion is a binary search of the segment table
+followed by one fixed-point multiplication.
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+from array import array
+
+_SHIFT = 15  # Fraction bits of the fixed-point milligrams per count factor
+
+
+def _multiply(counts, factor):
+    """Multiply counts by a fixed-point factor; returns the nearest integer."""
+    # Split counts into 8-bit parts so each product stays a small integer
+    high = counts >> 8
+    low = counts & 0xFF
+    return (high * factor + ((low * factor) >> 8) + (1 << (_SHIFT - 9))) >> (_SHIFT - 8)
+
+
+class MassConverter:
+    def __init__(self, calib_ratio=1.0):
+        """Instantiate a raw count to milligram converter for a channel.
+
+        :param float calib_ratio: The load cell calibration ratio in grams per
+        raw count, such as LoadCellConfig.CALIB_RATIO_1. Defaults to 1.0.
+        """
+        if calib_ratio <= 0:
+            raise ValueError("Calibration ratio must be greater than 0.")
+        self._scale = round(calib_ratio * 1000 * (1 << _SHIFT))
+
+    @property
+    def scale(self):
+        """The fixed-point milligrams per raw count factor."""
+        return self._scale
+
+    def to_mg(self, counts):
+        """Convert raw counts to the nearest integer milligram."""
+        return _multiply(counts, self._scale)
+
+    def to_counts(self, mg):
+        """Convert milligrams to the nearest raw count."""
+        return ((mg << _SHIFT) + self._scale // 2) // self._scale
+
+
+class CalibrationCurve:
+    def __init__(self, points):
+        """Instantiate a piecewise-linear raw count to milligram converter for
+        a channel from reference weight measurements. A measured zero-load
+        point, such as (150, 0), is used as the zero of the curve; a (0, 0)
+        point is added only if no point has zero grams. Readings outside the
+        reference points are extrapolated from the first or last segment.
+
+        :param points: A sequence of (raw counts, grams) pairs, one per
+        reference weight, such as LoadCellConfig.CALIB_POINTS_1.
+        """
+        points = sorted(points)
+        if not [point for point in points if point[1] == 0]:
+            points = sorted(points + [(0, 0)])
+        for i in range(len(points) - 1):
+            if points[i + 1][0] <= points[i][0] or points[i + 1][1] <= points[i][1]:
+                raise ValueError("Calibration points must increase.")
+        if len(points) < 2:
+            raise ValueError("Calibration needs a nonzero reference weight.")
+
+        # Segment table: starting raw counts, starting milligrams, and slope
+        segments = len(points) - 1
+        self._counts = array("i", [0] * segments)
+        self._mg = array("i", [0] * segments)
+        self._slopes = array("i", [0] * segments)
+        for i in range(segments):
+            counts, grams = points[i]
+            next_counts, next_grams = points[i + 1]
+            self._counts[i] = counts
+            self._mg[i] = grams_to_mg(grams)
+            self._slopes[i] = round(
+                (next_grams - grams) * 1000 * (1 << _SHIFT) / (next_counts - counts)
+            )
+
+    @property
+    def segments(self):
+        """The number of curve segments."""
+        return len(self._counts)
+
+    def _segment(self, table, value):
+        """Return the index of the segment whose starting table value is the
+        largest not exceeding value; 0 if value is below the first."""
+        low = 0
+        high = len(table) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if table[middle] <= value:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def to_mg(self, counts):
+        """Convert raw counts to the nearest integer milligram."""
+        i = self._segment(self._counts, counts)
+        return self._mg[i] + _multiply(counts - self._counts[i], self._slopes[i])
+
+    def to_counts(self, mg):
+        """Convert milligrams to the nearest raw count."""
+        i = self._segment(self._mg, mg)
+        slope = self._slopes[i]
+        return self._counts[i] + (((mg - self._mg[i]) << _SHIFT) + slope // 2) // slope
+
+
+def grams_to_mg(grams):
+    """Convert grams to the nearest integer milligram."""
+    return int(round(grams * 1000))
+
+
+def mg_to_grams(mg):
+    """Convert integer milligrams to grams rounded to 0.1 gram."""
+    return round(mg / 1000, 1)
+
+
+def format_mass(mg, width=5):
+    """Format integer milligrams as right-justified grams with one decimal
+    place, the same as '%5.1f' without a float or a '-0.0' result.
+
+    :param integer mg: The mass in milligrams.
+    :param integer width: The minimum text width. Defaults to 5."""
+    tenths = (abs(mg) + 50) // 100
+    text = "%d.%d" % (tenths // 10, tenths % 10)
+    if mg < 0 and tenths:
+        text = "-" + text
+    if len(text) < width:
+        text = " " * (width - len(text)) + text
+    return text
@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`memory.py`
+================================================================================
+
+The MemoryManager class for the dual-channel Scale project.
+cedargrove_scale.memory.py  2026-10-18 v1.0  Cedar Grove Studios
+
+An allocation-aware garbage collection policy for the main loop. update() is
+called once per scheduler pass with the idle time until the next task is due.
+It tracks the memory allocated since the previous pass and runs gc.collect()
+only when free memory falls below the low watermark or when the idle time is
+long enough for a typical collection and enough garbage has accumulated.
+Collections therefore run between tasks rather than during a measurement.
+The automatic collector remains enabled as a safety net; automatic
+collections are detected and counted.
+
+The free memory measured just after each managed collection is retained
+memory. A falling trend of that value indicates a leak or a fragmenting heap.
+
+  memory = MemoryManager()
+  scheduler.run(idle_function=memory.update)
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+import gc
+import time
+
+
+class MemoryManager:
+    def __init__(self, low_water=None, min_garbage=4096):
+        """Instantiate the memory manager and measure the heap.
+
+        :param integer low_water: The free memory in bytes below which a
+        collection runs without waiting for idle time. Defaults to one eighth
+        of the heap.
+        :param integer min_garbage: The memory in bytes that must be allocated
+        since the last collection before an idle collection runs. Defaults to
+        4096.
+        """
+        self.heap = gc.mem_alloc() + gc.mem_free()
+        if low_water is None:
+            low_water = self.heap // 8
+        self.low_water = low_water
+        self.min_garbage = min_garbage
+        self._free = gc.mem_free()
+        self.reset_stats()
+
+    @property
+    def free(self):
+        """The free memory in bytes measured at the last update."""
+        return self._free
+
+    @property
+    def garbage(self):
+        """The memory in bytes allocated since the last collection."""
+        return self._garbage
+
+    def reset_stats(self):
+        """Clear the collection and allocation counters."""
+        self.frames = 0
+        self.idle_frames = 0  # Frames with idle time before the next task
+        self.allocated = 0  # Bytes allocated over all frames
+        self.max_allocated = 0  # Largest allocation in a frame
+        self.collections = 0
+        self.watermark_collections = 0
+        self.idle_collections = 0
+        self.auto_collections = 0
+        self.last_duration = 0  # Microseconds
+        self.max_duration = 0
+        self._total_duration = 0
+        self._garbage = 0
+        self.first_retained = None  # Free bytes after the first collection
+        self.min_retained = None
+        self.last_retained = None
+
+    @property
+    def average_duration(self):
+        """The average managed collection duration in microseconds."""
+        if self.collections == 0:
+            return 0
+        return self._total_duration // self.collections
+
+    def collect(self):
+        """Run a garbage collection and record its duration and the free
+        memory retained afterward. Returns the duration in microseconds."""
+        start = time.monotonic_ns()
+        gc.collect()
+        duration = (time.monotonic_ns() - start) // 1000
+        self._free = gc.mem_free()
+        self._garbage = 0
+        self.collections += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self._total_duration += duration
+        if self.first_retained is None:
+            self.first_retained = self._free
+            self.min_retained = self._free
+        self.min_retained = min(self.min_retained, self._free)
+        self.last_retained = self._free
+        return duration
+
+    def update(self, idle=0):
+        """Track the memory allocated since the previous update and collect
+        if free memory is low or if the idle time permits. Returns True if a
+        collection was run.
+
+        :param float idle: The idle time in seconds until the next task is
+        due. Defaults to 0.
+        """
+        free = gc.mem_free()
+        self.frames += 1
+        if idle > 0:
+            self.idle_frames += 1
+        if free > self._free:
+            # Free memory grew without a managed collection
+            self.auto_collections += 1
+            self._garbage = 0
+        else:
+            allocated = self._free - free
+            self.allocated += allocated
+            self.max_allocated = max(self.max_allocated, allocated)
+            self._garbage += allocated
+        self._free = free
+
+        if free < self.low_water and self._garbage > 0:
+            self.collect()
+            self.watermark_collections += 1
+            return True
+        if (
+            self._garbage >= self.min_garbage
+            and idle > 0
+            and idle * 1000000 >= self.average_duration
+        ):
+            self.collect()
+            self.idle_collections += 1
+            return True
+        return False
+
+    def report(self):
+        """Print the collection, allocation, and retained memory statistics
+        to the REPL."""
+        frames = max(self.frames, 1)
+        print(
+            "  gc: %d collections (%d watermark, %d idle), %d automatic"
+            % (
+                self.collections,
+                self.watermark_collections,
+                self.idle_collections,
+                self.auto_collections,
+            )
+        )
+        print(
+            "  gc duration ms: avg %5.2f  max %5.2f"
+            % (self.average_duration / 1000, self.max_duration / 1000)
+        )
+        print(
+            "  allocated bytes/frame: avg %d  max %d"
+            % (self.allocated // frames, self.max_allocated)
+        )
+        print("  idle frames: %d of %d" % (self.idle_frames, self.frames))
+        if self.last_retained is not None:
+            print(
+                "  free after gc: first %d  min %d  last %d  of %d bytes"
+                % (
+                    self.first_retained,
+                    self.min_retained,
+                    self.last_retained,
+                    self.heap,
+                )
+            )
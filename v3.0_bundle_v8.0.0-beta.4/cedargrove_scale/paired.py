@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`paired.py`
+================================================================================
+
+The PairedSampler class for the dual-channel Scale project.
+cedargrove_scale.paired.py  2026-10-18 v1.0  Cedar Grove Studios
+
+Time-aligned sampling of two single channel NAU7802 devices, one load cell
+each. The conversion cycles of both devices are restarted together and one
+conversion from each device is stored as a timestamped pair. No channel
+multiplexer switching is needed, so there is no settling delay between the two
+readings of a pair. Instantiate each NAU7802 with active_channels=1 to enable
+its PGA output stabilizer capacitor.
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+* Two Cedar Grove NAU7802 Feather Wings (or SparkFun Qwiic Scales)
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+import time
+from array import array
+
+
+class PairedSampler:
+    def __init__(self, nau7802_a=None, nau7802_b=None, size=64):
+        """Instantiate the paired sample ring buffers and synchronize the two
+        devices' conversion cycles.
+
+        :param class nau7802_a: The first single channel NAU7802 instance.
+        :param class nau7802_b: The second single channel NAU7802 instance.
+        :param integer size: The ring buffer length in sample pairs. Defaults
+        to 64.
+        """
+        if nau7802_a is None or nau7802_b is None:
+            raise RuntimeError("*** ERROR: Two NAU7802 devices required.")
+        if size < 1:
+            raise ValueError("Size must be 1 or greater.")
+        self._devices = (nau7802_a, nau7802_b)
+        self._size = size
+        self._samples_a = array("i", [0] * size)
+        self._samples_b = array("i", [0] * size)
+        self._times = array("L", [0] * size)
+        self._block_a = array("i", [0] * size)  # read_block() scratch buffers
+        self._block_b = array("i", [0] * size)
+        self._head = 0
+        self._count = 0
+        self._unread = 0
+        self._pending = [None, None]  # Conversion awaiting its partner
+        self._ready_time = [0, 0]  # Millisecond ready time of each conversion
+        self._skew = 0  # Ready time difference of the last pair in ms
+        self._max_skew = 0
+        self._resyncs = 0
+        self.synchronize()
+
+    @property
+    def size(self):
+        """The ring buffer length in sample pairs."""
+        return self._size
+
+    @property
+    def count(self):
+        """The number of valid sample pairs stored."""
+        return self._count
+
+    @property
+    def unread(self):
+        """The number of sample pairs not yet retrieved with drain()."""
+        return self._unread
+
+    @property
+    def skew(self):
+        """The ready time difference in milliseconds between the two
+        conversions of the most recent pair."""
+        return self._skew
+
+    @property
+    def max_skew(self):
+        """The largest pair ready time difference observed in milliseconds."""
+        return self._max_skew
+
+    @property
+    def resyncs(self):
+        """The number of times the conversion cycles were re-synchronized."""
+        return self._resyncs
+
+    def synchronize(self):
+        """Restart both devices' conversion cycles back-to-back and discard
+        any conversion started before the restart."""
+        for device in self._devices:
+            device.start_conversion()
+        for index, device in enumerate(self._devices):
+            if device.available():
+                device.read()  # Clear a conversion completed before restart
+            self._pending[index] = None
+        self._resyncs += 1
+
+    def update(self):
+        """Read whichever device conversions are ready. Returns True when a
+        complete pair was stored; False otherwise. The devices' internal
+        clocks drift apart over time, so the conversion cycles are
+        re-synchronized when the pair skew exceeds half a conversion
+        period."""
+        for index, device in enumerate(self._devices):
+            if self._pending[index] is None and device.available():
+                self._pending[index] = device.read()
+                self._ready_time[index] = time.monotonic_ns() // 1000000
+        if self._pending[0] is None or self._pending[1] is None:
+            return False
+
+        head = self._head
+        self._samples_a[head] = self._pending[0]
+        self._samples_b[head] = self._pending[1]
+        self._times[head] = (
+            (self._ready_time[0] + self._ready_time[1]) // 2
+        ) & 0xFFFFFFFF
+        self._head = (head + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+        if self._unread < self._size:
+            self._unread += 1
+        self._pending[0] = self._pending[1] = None
+
+        self._skew = abs(self._ready_time[0] - self._ready_time[1])
+        self._max_skew = max(self._max_skew, self._skew)
+        if self._skew * self._devices[0].conversion_rate > 500:
+            self.synchronize()
+        return True
+
+    def latest(self):
+        """The most recent (a, b) raw sample pair or None if no pairs have been
+        stored."""
+        if self._count == 0:
+            return None
+        index = (self._head - 1) % self._size
+        return self._samples_a[index], self._samples_b[index]
+
+    def latest_time(self):
+        """The millisecond timestamp of the most recent pair or None."""
+        if self._count == 0:
+            return None
+        return self._times[(self._head - 1) % self._size]
+
+    def read_block(self, samples=None):
+        """Return a tuple of memoryviews of the most recent a and b samples,
+        oldest first. The views refer to internal scratch buffers that are
+        overwritten by the next read_block() call.
+
+        :param integer samples: The number of pairs. Defaults to all stored
+        pairs; limited to the number of pairs stored."""
+        if samples is None or samples > self._count:
+            samples = self._count
+        start = (self._head - samples) % self._size
+        for i in range(samples):
+            index = (start + i) % self._size
+            self._block_a[i] = self._samples_a[index]
+            self._block_b[i] = self._samples_b[index]
+        return (
+            memoryview(self._block_a)[:samples],
+            memoryview(self._block_b)[:samples],
+        )
+
+    def drain(self, buffer_a, buffer_b, times=None):
+        """Copy the unread sample pairs into caller-provided buffers, oldest
+        first, and mark them as read. Returns the number of pairs copied;
+        limited to the shorter buffer length.
+
+        :param array buffer_a: The destination buffer for device a samples.
+        :param array buffer_b: The destination buffer for device b samples.
+        :param array times: Optional destination timestamp buffer."""
+        samples = min(self._unread, len(buffer_a), len(buffer_b))
+        start = (self._head - self._unread) % self._size
+        for i in range(samples):
+            index = (start + i) % self._size
+            buffer_a[i] = self._samples_a[index]
+            buffer_b[i] = self._samples_b[index]
+            if times is not None:
+                times[i] = self._times[index]
+        self._unread -= samples
+        return samples
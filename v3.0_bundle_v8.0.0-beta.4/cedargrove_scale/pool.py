@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`pool.py`
+================================================================================
+
+The DevicePool class for the dual-channel Scale project.
+cedargrove_scale.pool.py  2026-10-18 v1.0  Cedar Grove Studios
+
+Collects samples from several NAU7802 devices, for example one per channel of
+a TCA9548A I2C multiplexer or on separate I2C buses. Every NAU7802 converts
+continuously and independently, so the pool polls each device in turn and
+stores a conversion as soon as that device is ready. The aggregate sample rate
+grows with the number of devices instead of being limited by one device's
+channel multiplexer.
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+* Cedar Grove NAU7802 Feather Wing
+* Adafruit TCA9548A 1-to-8 I2C Multiplexer (optional)
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+from cedargrove_scale.sampler import Sampler
+
+
+class DevicePool:
+    def __init__(self, devices=None, channels=(1,), size=64, dwell=1):
+        """Instantiate a pool of NAU7802 devices with a sampler for each.
+
+        :param list devices: The NAU7802 (or FakeNAU7802) driver instances.
+        :param tuple channels: The channel numbers to sample on each device.
+        Defaults to (1,); use single channel devices for the highest rate.
+        :param integer size: The ring buffer length in samples per device
+        channel. Defaults to 64.
+        :param integer dwell: The number of samples to acquire from a channel
+        before switching channels on a dual channel device. Defaults to 1.
+        """
+        if not devices:
+            raise RuntimeError("*** ERROR: No NAU7802 devices specified.")
+        self._devices = tuple(devices)
+        self._samplers = tuple(
+            Sampler(device, channels=channels, size=size, dwell=dwell)
+            for device in self._devices
+        )
+        self._ready = [0] * len(self._devices)  # Samples stored per device
+
+    @classmethod
+    def from_buses(cls, driver, buses, address=0x2A, active_channels=1, **kwargs):
+        """Instantiate a driver for each I2C bus and return a pool of the
+        devices. Use the channel objects of a TCA9548A multiplexer as buses
+        to attach up to eight NAU7802 devices at the same address.
+
+        :param class driver: The NAU7802 or FakeNAU7802 class.
+        :param list buses: The I2C bus objects, one per device.
+        :param integer address: The device I2C address. Defaults to 0x2A.
+        :param integer active_channels: Channels per device. Defaults to 1.
+        """
+        devices = [
+            driver(bus, address=address, active_channels=active_channels)
+            for bus in buses
+        ]
+        return cls(devices, **kwargs)
+
+    def __len__(self):
+        return len(self._devices)
+
+    @property
+    def devices(self):
+        """The pooled NAU7802 driver instances."""
+        return self._devices
+
+    def sampler(self, index):
+        """The Sampler instance for the device at index."""
+        return self._samplers[index]
+
+    def sample_count(self, index):
+        """The total number of samples stored from the device at index."""
+        return self._ready[index]
+
+    def update(self):
+        """Poll every device once and store each ready conversion. Returns the
+        number of samples stored."""
+        stored = 0
+        for index, sampler in enumerate(self._samplers):
+            if sampler.update():
+                self._ready[index] += 1
+                stored += 1
+        return stored
+
+    def latest(self, index, channel=1):
+        """The most recent raw sample value of the device channel or None if
+        no samples have been stored."""
+        return self._samplers[index].latest(channel)
+
+    def latest_time(self, index, channel=1):
+        """The millisecond timestamp of the most recent sample of the device
+        channel or None if no samples have been stored."""
+        return self._samplers[index].latest_time(channel)
+
+    def read_block(self, index, channel=1, samples=None):
+        """Return a memoryview of the most recent samples of the device
+        channel, oldest first. See Sampler.read_block()."""
+        return self._samplers[index].read_block(channel, samples)
+
+    def drain(self, index, buffer, channel=1, times=None):
+        """Copy the unread samples of the device channel into a caller-provided
+        buffer. Returns the number of samples copied. See Sampler.drain()."""
+        return self._samplers[index].drain(channel, buffer, times)
+
+    def clear(self):
+        """Discard stored samples for all devices."""
+        for index, sampler in enumerate(self._samplers):
+            sampler.clear()
+            self._ready[index] = 0
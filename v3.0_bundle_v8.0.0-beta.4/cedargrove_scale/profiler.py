@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`profiler.py`
+================================================================================
+
+The Profiler class for the dual-channel Scale project.
+cedargrove_scale.profiler.py  2026-10-18 v1.0  Cedar Grove Studios
+
+A lightweight per-phase timer for the main loop. Each named phase, such as
+channel reads or the display refresh, is timed with time.monotonic_ns(). The
+most recent durations of each phase are kept in a fixed-size array ring buffer
+in microseconds, so timing a phase does not grow the heap. report() prints
+the count, minimum, average, 95th percentile, and maximum duration of every
+phase and its share of the total profiled time. A phase that overlaps other
+phases, such as the mux settling time that elapses between channel reads, is
+reported without a share and is left out of the total.
+
+  profiler = Profiler(("labels", "settle"), overlapping=("settle",))
+  with profiler.phase("labels"):
+      update_labels()
+  profiler.phase("settle").record(settle_microseconds)  # Measured elsewhere
+  scheduler.add("touch", profiler.wrap("touch", poll_touch), period=0.05)
+  profiler.report()
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+import time
+from array import array
+
+
+class Phase:
+    def __init__(self, name, size=64, overlapping=False):
+        """Instantiate a timed phase. See Profiler.add()."""
+        if size < 1:
+            raise ValueError("Size must be 1 or greater.")
+        self.name = name
+        self.overlapping = overlapping
+        self._size = size
+        self._durations = array("L", [0] * size)  # Microseconds
+        self._start = None
+        self.reset()
+
+    def reset(self):
+        """Discard the recorded durations."""
+        self._head = 0
+        self._count = 0
+        self.runs = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def begin(self):
+        """Start timing the phase."""
+        self._start = time.monotonic_ns()
+
+    def end(self):
+        """Stop timing the phase and record the duration. Returns the duration
+        in microseconds."""
+        if self._start is None:
+            return 0
+        duration = (time.monotonic_ns() - self._start) // 1000
+        self._start = None
+        self.record(duration)
+        return duration
+
+    def record(self, duration):
+        """Record a phase duration in microseconds."""
+        self._durations[self._head] = duration
+        self._head = (self._head + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+        self.runs += 1
+        self.total += duration
+        if self.min is None or duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+
+    @property
+    def average(self):
+        """The average duration in microseconds since the last reset."""
+        if self.runs == 0:
+            return 0
+        return self.total // self.runs
+
+    @property
+    def p95(self):
+        """The 95th percentile duration in microseconds of the durations in
+        the ring buffer."""
+        if self._count == 0:
+            return 0
+        ordered = sorted(self._durations[: self._count])
+        return ordered[(self._count * 95 + 99) // 100 - 1]
+
+    @property
+    def stats(self):
+        """A tuple of the number of runs and the minimum, average, 95th
+        percentile, and maximum durations in microseconds."""
+        return (self.runs, self.min or 0, self.average, self.p95, self.max)
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end()
+        return False
+
+
+class Profiler:
+    def __init__(self, phases=(), size=64, overlapping=()):
+        """Instantiate the profiler.
+
+        :param tuple phases: The phase names to add in report order. Phases
+        may also be added later with add().
+        :param integer size: The number of recent durations kept per phase
+        for the 95th percentile. Defaults to 64.
+        :param tuple overlapping: The names of phases that overlap other
+        phases. See add(). Defaults to none.
+        """
+        self._size = size
+        self._phases = {}
+        self._order = []
+        for name in phases:
+            self.add(name, name in overlapping)
+
+    @property
+    def phases(self):
+        """The Phase instances in report order."""
+        return [self._phases[name] for name in self._order]
+
+    def add(self, name, overlapping=False):
+        """Add a phase and return its Phase instance. Returns the existing
+        instance if the phase was already added.
+
+        :param str name: The phase name for reports.
+        :param bool overlapping: True if the phase time elapses during other
+        phases or between them, so it is not part of the total profiled time.
+        Defaults to False.
+        """
+        if name not in self._phases:
+            self._phases[name] = Phase(name, self._size, overlapping)
+            self._order.append(name)
+        return self._phases[name]
+
+    def phase(self, name):
+        """The Phase instance with the name; use in a with statement to time
+        a block of code."""
+        return self._phases[name]
+
+    def wrap(self, name, function):
+        """Return a function that calls function as a timed phase. The phase
+        is added if needed."""
+        phase = self.add(name)
+
+        def timed():
+            phase.begin()
+            try:
+                return function()
+            finally:
+                phase.end()
+
+        return timed
+
+    def reset(self):
+        """Discard the recorded durations of all phases."""
+        for phase in self._phases.values():
+            phase.reset()
+
+    def report(self):
+        """Print the phase statistics in milliseconds to the REPL. The share
+        of an overlapping phase is shown as '-'."""
+        total = 0
+        for phase in self._phases.values():
+            if not phase.overlapping:
+                total += phase.total
+        print("  phase        runs     min     avg     p95     max  share")
+        for name in self._order:
+            phase = self._phases[name]
+            runs, minimum, average, p95, maximum = phase.stats
+            if phase.overlapping:
+                share = "   -"
+            else:
+                share = "%3d%%" % (0 if total == 0 else phase.total * 100 // total)
+            print(
+                "  %-9s %7d %7.2f %7.2f %7.2f %7.2f  %s"
+                % (
+                    name,
+                    runs,
+                    minimum / 1000,
+                    average / 1000,
+                    p95 / 1000,
+                    maximum / 1000,
+                    share,
+                )
+            )
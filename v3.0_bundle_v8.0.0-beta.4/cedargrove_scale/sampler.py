@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`sampler.py`
+================================================================================
+
+The Sampler class for the dual-channel Scale project.
+cedargrove_scale.sampler.py  2026-10-18 v1.0  Cedar Grove Studios
+
+A continuous NAU7802 acquisition engine. Raw ADC samples and their millisecond
+timestamps are stored in fixed-size array ring buffers, one pair per channel.
+Call update() as often as possible from the main loop; it returns immediately
+if a conversion is not ready. Channel switches settle over later update() calls
+without blocking. Sample values are then retrieved with latest(),
+read_block(), or drain() without allocating a new buffer per sample.
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+* Cedar Grove NAU7802 Feather Wing
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+import time
+from array import array
+
+
+class Sampler:
+    def __init__(self, nau7802=None, channels=(1, 2), size=64, dwell=1):
+        """Instantiate the sampler ring buffers.
+
+        :param class nau7802: The NAU7802 (or FakeNAU7802) driver instance.
+        :param tuple channels: The channel numbers to sample in rotation.
+        Defaults to (1, 2).
+        :param integer size: The ring buffer length in samples per channel.
+        Defaults to 64.
+        :param integer dwell: The number of samples to acquire from a channel
+        before switching to the next channel. Defaults to 1.
+        """
+        if nau7802 is None:
+            raise RuntimeError("*** ERROR: No NAU7802 specified.")
+        if size < 1 or dwell < 1:
+            raise ValueError("Size and dwell must be 1 or greater.")
+        self._nau7802 = nau7802
+        self._channels = tuple(channels)
+        self._size = size
+        self._dwell = dwell
+
+        self._samples = {}
+        self._times = {}
+        self._head = {}  # Index of the next sample to be written
+        self._count = {}  # Number of valid samples in the buffer
+        self._unread = {}  # Number of samples not yet drained
+        for chan in self._channels:
+            self._samples[chan] = array("i", [0] * size)
+            self._times[chan] = array("L", [0] * size)
+            self._head[chan] = 0
+            self._count[chan] = 0
+            self._unread[chan] = 0
+        self._block = array("i", [0] * size)  # read_block() scratch buffer
+        self._block_view = memoryview(self._block)
+
+        self._index = 0  # Position of the active channel in channels
+        self._settle = None  # Channel settling step sequence
+        self.restart()  # Select the first channel without blocking
+
+    @property
+    def channels(self):
+        """The sampled channel numbers."""
+        return self._channels
+
+    @property
+    def channel(self):
+        """The channel currently being sampled."""
+        return self._channels[self._index]
+
+    @property
+    def size(self):
+        """The ring buffer length in samples per channel."""
+        return self._size
+
+    def count(self, channel):
+        """The number of valid samples stored for the channel."""
+        return self._count[channel]
+
+    def unread(self, channel):
+        """The number of samples not yet retrieved with drain()."""
+        return self._unread[channel]
+
+    @property
+    def settling(self):
+        """True while the channel is settling after a switch."""
+        return self._settle is not None
+
+    def restart(self):
+        """Abandon any channel settling in progress and reselect the current
+        channel without blocking. Use after another part of the program has
+        selected a channel."""
+        self._dwell_count = 0
+        self._settle = self._nau7802.channel_steps(self._channels[self._index])
+        self._resume_ms = 0
+
+    def _step_settle(self):
+        """Advance the channel settling sequence when its wait has elapsed.
+        Returns True when settling is complete."""
+        now = time.monotonic_ns() // 1000000
+        if now < self._resume_ms:
+            return False
+        try:
+            self._resume_ms = now + int(next(self._settle) * 1000)
+        except StopIteration:
+            self._settle = None
+            return True
+        return False
+
+    def update(self):
+        """Acquire a sample if a conversion is ready. Returns True if a sample
+        was stored; False if the ADC was not ready or the channel is settling.
+        Starts switching to the next channel after dwell samples."""
+        if self._settle is not None and not self._step_settle():
+            return False
+        if not self._nau7802.available():
+            return False
+        chan = self._channels[self._index]
+        head = self._head[chan]
+        self._samples[chan][head] = self._nau7802.read()
+        self._times[chan][head] = (time.monotonic_ns() // 1000000) & 0xFFFFFFFF
+        self._head[chan] = (head + 1) % self._size
+        if self._count[chan] < self._size:
+            self._count[chan] += 1
+        if self._unread[chan] < self._size:
+            self._unread[chan] += 1
+
+        self._dwell_count += 1
+        if self._dwell_count >= self._dwell and len(self._channels) > 1:
+            self._dwell_count = 0
+            self._index = (self._index + 1) % len(self._channels)
+            self._settle = self._nau7802.channel_steps(self._channels[self._index])
+            self._resume_ms = 0
+        return True
+
+    def latest(self, channel):
+        """The most recent raw sample value for the channel or None if no
+        samples have been stored."""
+        if self._count[channel] == 0:
+            return None
+        return self._samples[channel][(self._head[channel] - 1) % self._size]
+
+    def latest_time(self, channel):
+        """The millisecond timestamp of the most recent sample for the channel
+        or None if no samples have been stored."""
+        if self._count[channel] == 0:
+            return None
+        return self._times[channel][(self._head[channel] - 1) % self._size]
+
+    def read_block(self, channel, samples=None):
+        """Return a memoryview of the most recent samples for the channel in
+        acquisition order, oldest first. The view refers to an internal scratch
+        buffer that is overwritten by the next read_block() call.
+
+        :param integer samples: The number of samples. Defaults to all stored
+        samples; limited to the number of samples stored."""
+        if samples is None or samples > self._count[channel]:
+            samples = self._count[channel]
+        buf = self._samples[channel]
+        start = (self._head[channel] - samples) % self._size
+        for i in range(samples):
+            self._block[i] = buf[(start + i) % self._size]
+        return self._block_view[:samples]
+
+    def drain(self, channel, buffer, times=None):
+        """Copy the unread samples for the channel into a caller-provided
+        buffer, oldest first, and mark them as read. Returns the number of
+        samples copied; limited to the buffer length.
+
+        :param array buffer: The destination sample buffer.
+        :param array times: Optional destination timestamp buffer."""
+        samples = min(self._unread[channel], len(buffer))
+        buf = self._samples[channel]
+        stamps = self._times[channel]
+        start = (self._head[channel] - self._unread[channel]) % self._size
+        for i in range(samples):
+            index = (start + i) % self._size
+            buffer[i] = buf[index]
+            if times is not None:
+                times[i] = stamps[index]
+        self._unread[channel] -= samples
+        return samples
+
+    def clear(self, channel=None):
+        """Discard stored samples for the channel or for all channels."""
+        for chan in self._channels:
+            if channel is None or chan == channel:
+                self._head[chan] = 0
+                self._count[chan] = 0
+                self._unread[chan] = 0
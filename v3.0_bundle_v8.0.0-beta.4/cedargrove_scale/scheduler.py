@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`scheduler.py`
+================================================================================
+
+The Scheduler class for the dual-channel Scale project.
+cedargrove_scale.scheduler.py  2026-10-18 v1.0  Cedar Grove Studios
+
+A cooperative, tick-based task scheduler for the main loop. Each task is a
+function with a declared period and deadline in seconds. run_once() calls every
+task that is due, in the order the tasks were added, and returns the idle time
+until the next task is due. A task that completes later than its deadline
+after its due time is counted as a deadline miss. Task functions must return
+promptly; a long wait should be split into steps across calls.
+
+  scheduler = Scheduler()
+  scheduler.add("acquire", acquire, period=0.05, deadline=0.1)
+  scheduler.add("display", refresh, period=0.1, deadline=0.05)
+  scheduler.run()
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+import time
+
+
+def _ms():
+    """The monotonic time in integer milliseconds."""
+    return time.monotonic_ns() // 1000000
+
+
+class Task:
+    def __init__(self, name, function, period=0, deadline=None):
+        """Instantiate a scheduled task. See Scheduler.add()."""
+        self.name = name
+        self.function = function
+        self.period = period
+        self.deadline = deadline
+        self.enable = True
+        self._due = _ms()
+        self.reset_stats()
+
+    @property
+    def period(self):
+        """The task period in seconds; 0 runs the task on every pass."""
+        return self._period_ms / 1000
+
+    @period.setter
+    def period(self, seconds=0):
+        self._period_ms = int(seconds * 1000)
+
+    @property
+    def deadline(self):
+        """The time in seconds after the due time by which the task must
+        complete."""
+        return self._deadline_ms / 1000
+
+    @deadline.setter
+    def deadline(self, seconds=None):
+        if seconds is None:
+            self._deadline_ms = max(self._period_ms, 1)
+        else:
+            self._deadline_ms = int(seconds * 1000)
+
+    @property
+    def stats(self):
+        """Task counters: a tuple of the number of runs, deadline misses,
+        maximum lateness of the start in ms, and maximum duration in ms."""
+        return (self.runs, self.misses, self.max_late, self.max_duration)
+
+    def reset_stats(self):
+        """Clear the task counters."""
+        self.runs = 0
+        self.misses = 0
+        self.max_late = 0
+        self.max_duration = 0
+
+    def due_in(self, now):
+        """The time in ms until the task is due; 0 or less when due."""
+        return self._due - now
+
+    def run(self, now):
+        """Call the task function and update the counters. now is the time
+        in ms that the task was found due."""
+        late = now - self._due
+        self.function()
+        finish = _ms()
+        self.runs += 1
+        self.max_late = max(self.max_late, late)
+        self.max_duration = max(self.max_duration, finish - now)
+        if finish - self._due > self._deadline_ms:
+            self.misses += 1
+        # Keep the task's cadence; skip periods that were missed entirely
+        self._due += self._period_ms
+        if self._due <= finish:
+            self._due = finish + self._period_ms
+        return finish
+
+
+class Scheduler:
+    def __init__(self):
+        """Instantiate an empty scheduler."""
+        self._tasks = []
+
+    @property
+    def tasks(self):
+        """The scheduled Task instances in run order."""
+        return self._tasks
+
+    def add(self, name, function, period=0, deadline=None):
+        """Add a task and return its Task instance.
+
+        :param str name: The task name for reports.
+        :param function function: The task function; called without
+        arguments.
+        :param float period: The task period in seconds. Defaults to 0, which
+        runs the task on every pass and leaves no idle time; use it only for a
+        task that must poll continuously.
+        :param float deadline: The time in seconds after the due time by which
+        the task must complete. Defaults to the period.
+        """
+        task = Task(name, function, period, deadline)
+        self._tasks.append(task)
+        return task
+
+    def task(self, name):
+        """The Task instance with the name or None."""
+        for task in self._tasks:
+            if task.name == name:
+                return task
+        return None
+
+    def run_once(self):
+        """Run every enabled task that is due. Returns the idle time in
+        seconds until the next task is due."""
+        now = _ms()
+        for task in self._tasks:
+            if task.enable and task.due_in(now) <= 0:
+                now = task.run(now)
+        idle = None
+        for task in self._tasks:
+            if task.enable:
+                wait = task.due_in(now)
+                if idle is None or wait < idle:
+                    idle = wait
+        if idle is None or idle < 0:
+            return 0
+        return idle / 1000
+
+    def run(self, idle_function=None):
+        """Run the tasks indefinitely, sleeping while no task is due.
+
+        :param function idle_function: A function called after every pass
+        with the idle time in seconds until the next task is due, such as
+        MemoryManager.update. Defaults to None.
+        """
+        while True:
+            idle = self.run_once()
+            if idle_function is not None:
+                start = _ms()
+                idle_function(idle)
+                idle -= (_ms() - start) / 1000
+            if idle > 0:
+                time.sleep(idle)
+
+    def report(self):
+        """Print the task counters to the REPL."""
+        print("  task       runs  misses  late ms  max ms")
+        for task in self._tasks:
+            print("  %-9s %6d  %6d  %7d  %6d" % ((task.name,) + task.stats))
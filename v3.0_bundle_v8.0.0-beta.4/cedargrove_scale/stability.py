@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`stability.py`
+================================================================================
+
+The StabilityDetector class for the dual-channel Scale project.
+cedargrove_scale.stability.py  2026-10-18 v1.0  Cedar Grove Studios
+
+Detects when a load cell reading has settled. The mean and variance of a
+sliding window of samples are updated incrementally as each sample enters and
+leaves the window. A reading is stable once the window's standard deviation
+and the newest sample's distance from the window mean have both stayed within
+the band for the minimum duration. Use one detector per channel.
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+import time
+from array import array
+
+# Distance from the reference value that triggers re-referencing of the sums
+_REREFERENCE = 0x4000
+
+
+class StabilityDetector:
+    def __init__(self, window=8, band=512, duration=0.5):
+        """Instantiate the stability detector.
+
+        :param integer window: The number of samples in the sliding window.
+        Defaults to 8.
+        :param integer band: The stability band in sample units, typically raw
+        counts. Defaults to 512.
+        :param float duration: The minimum time in seconds that the samples
+        must stay within the band. Defaults to 0.5.
+        """
+        if window < 2:
+            raise ValueError("Window must be 2 or greater.")
+        self._window = window
+        self._buffer = array("i", [0] * window)
+        self.band = band
+        self.duration = duration
+        self.reset()
+
+    @property
+    def window(self):
+        """The number of samples in the sliding window."""
+        return self._window
+
+    @property
+    def stable(self):
+        """True when the samples have stayed within the band for the minimum
+        duration."""
+        return self._stable
+
+    @property
+    def settled(self):
+        """The window mean if stable; None otherwise."""
+        if self._stable:
+            return self.mean
+        return None
+
+    @property
+    def mean(self):
+        """The rounded mean of the samples in the window or None if empty."""
+        if self._count == 0:
+            return None
+        return self._reference + (self._sum + self._count // 2) // self._count
+
+    @property
+    def variance(self):
+        """The variance of the samples in the window in sample units squared
+        or None if empty."""
+        if self._count == 0:
+            return None
+        count = self._count
+        return max(0, count * self._sum_sq - self._sum * self._sum) / (count * count)
+
+    @property
+    def deviation(self):
+        """The standard deviation of the samples in the window or None if
+        empty."""
+        if self._count == 0:
+            return None
+        return self.variance**0.5
+
+    @property
+    def stable_time(self):
+        """The time in seconds that the samples have stayed within the band;
+        0 when outside the band."""
+        if self._in_band_since is None:
+            return 0
+        return self._now - self._in_band_since
+
+    def reset(self):
+        """Discard the window and clear the stable status."""
+        self._head = 0
+        self._count = 0
+        self._reference = 0
+        self._sum = 0
+        self._sum_sq = 0
+        self._in_band_since = None
+        self._now = 0
+        self._stable = False
+
+    def _rereference(self, reference):
+        """Recalculate the window sums relative to a new reference value. The
+        sums are kept relative to a recent sample so that they remain small
+        integers."""
+        self._reference = reference
+        self._sum = 0
+        self._sum_sq = 0
+        for i in range(self._count):
+            index = (self._head - 1 - i) % self._window
+            delta = self._buffer[index] - reference
+            self._sum += delta
+            self._sum_sq += delta * delta
+
+    def update(self, sample, now=None):
+        """Add a sample and return the stable status.
+
+        :param integer sample: The sample value.
+        :param float now: The sample time in seconds. Defaults to
+        time.monotonic()."""
+        if now is None:
+            now = time.monotonic()
+        self._now = now
+        if self._count == 0:
+            self._reference = sample
+
+        if self._count == self._window:
+            delta = self._buffer[self._head] - self._reference
+            self._sum -= delta
+            self._sum_sq -= delta * delta
+        else:
+            self._count += 1
+        self._buffer[self._head] = sample
+        self._head = (self._head + 1) % self._window
+        delta = sample - self._reference
+        self._sum += delta
+        self._sum_sq += delta * delta
+        if abs(delta) > _REREFERENCE:
+            self._rereference(sample)
+
+        in_band = (
+            self._count == self._window
+            and abs(sample - self.mean) <= self.band
+            and self.variance <= self.band * self.band
+        )
+        if not in_band:
+            self._in_band_since = None
+            self._stable = False
+        else:
+            if self._in_band_since is None:
+                self._in_band_since = now
+            self._stable = now - self._in_band_since >= self.duration
+        return self._stable
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`zero_tracking.py`
+================================================================================
+
+The ZeroTracker class for the dual-channel Scale project.
+cedargrove_scale.zero_tracking.py  2026-10-18 v1.0  Cedar Grove Studios
+
+Automatic zero tracking. Slow zero drift is absorbed into a software offset
+that is subtracted from the raw value. Tracking is active only while the
+reading is stable and within the tracking band around zero, and the offset
+changes no faster than the tracking rate, so a load placed on the scale is
+never tracked away. The total offset is limited; once the limit is reached
+the channel should be zeroed with a hardware calibration. Use one tracker per
+channel.
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+# imports__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Scale"
+
+
+import time
+
+
+class ZeroTracker:
+    def __init__(self, band=512, rate=256, limit=8192):
+        """Instantiate the zero tracker.
+
+        :param integer band: The tracking band around zero in raw counts.
+        Defaults to 512.
+        :param integer rate: The maximum offset change in raw counts per
+        second. Defaults to 256.
+        :param integer limit: The maximum total offset in raw counts.
+        Defaults to 8192.
+        """
+        self.band = band
+        self.rate = rate
+        self.limit = limit
+        self.enable = True
+        self.reset()
+
+    @property
+    def offset(self):
+        """The software zero offset in raw counts."""
+        return self._offset
+
+    @property
+    def tracking(self):
+        """True if the last update was within the tracking band while
+        stable."""
+        return self._tracking
+
+    @property
+    def limited(self):
+        """True when the offset has reached the limit. Zero the channel with a
+        hardware calibration and reset the tracker."""
+        return abs(self._offset) >= self.limit
+
+    def reset(self):
+        """Clear the software offset. Use after a hardware zero
+        calibration."""
+        self._offset = 0
+        self._tracking = False
+        self._last_ms = None
+
+    def update(self, value, stable, now=None):
+        """Track the zero and return the raw value with the software offset
+        removed.
+
+        :param integer value: The filtered raw value.
+        :param bool stable: The reading's stability status.
+        :param integer now: The time in milliseconds. Defaults to
+        time.monotonic_ns() // 1000000."""
+        if now is None:
+            now = time.monotonic_ns() // 1000000
+        corrected = value - self._offset
+        self._tracking = self.enable and stable and abs(corrected) <= self.band
+        if not self._tracking or self._last_ms is None:
+            self._last_ms = now  # The rate allowance starts when tracking
+            return corrected
+
+        # Move the offset toward the reading within the rate allowance
+        step = self.rate * (now - self._last_ms) // 1000
+        if step == 0:
+            return corrected  # Let the allowance accumulate
+        step = max(-step, min(step, corrected))
+        self._offset = max(-self.limit, min(self.limit, self._offset + step))
+        self._last_ms = now
+        return value - self._offset
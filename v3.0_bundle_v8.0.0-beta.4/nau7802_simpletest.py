@@ -12,8 +12,11 @@ import time
 import board
 from cedargrove_nau7802 import NAU7802
 
+# Optional NAU7802 DRDY pin connection; None to poll data-ready over I2C
+DRDY_PIN = None  # for example, board.D5
+
 # Instantiate 24-bit load sensor ADC; two channels, default gain of 128
-nau7802 = NAU7802(board.I2C(), address=0x2A, active_channels=2)
+nau7802 = NAU7802(board.I2C(), address=0x2A, active_channels=2, drdy_pin=DRDY_PIN)
 
 
 def zero_channel():
@@ -45,9 +48,8 @@ def read_raw_value(samples=2):
 
 # Instantiate and calibrate load cell inputs
 print("*** Instantiate and calibrate load cells")
-# Enable NAU7802 digital and analog power
-enabled = nau7802.enable(True)
-print("Digital and analog power enabled:", enabled)
+# Digital and analog power were enabled when the NAU7802 was instantiated
+print("NAU7802 startup time: %5.3f sec" % nau7802.startup_time)
 
 print("REMOVE WEIGHTS FROM LOAD CELLS")
 time.sleep(3)
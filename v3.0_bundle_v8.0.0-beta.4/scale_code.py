@@ -48,16 +48,30 @@ __repo__ = "https://github.com/CedarGroveStudios/Scale"
 import board
 import displayio
 import gc
+import sys
 import time
+import supervisor
+from array import array
 from cedargrove_nau7802 import NAU7802
 from cedargrove_fake_nau7802 import FakeNAU7802
 import cedargrove_scale.graphics
 import cedargrove_scale.buttons
+from cedargrove_scale.filters import FilterChain
+from cedargrove_scale.stability import StabilityDetector
+from cedargrove_scale.mass import MassConverter, CalibrationCurve
+from cedargrove_scale.mass import format_mass, grams_to_mg, mg_to_grams
+from cedargrove_scale.zero_tracking import ZeroTracker
+from cedargrove_scale.sampler import Sampler
+from cedargrove_scale.scheduler import Scheduler
+from cedargrove_scale.display_state import DisplayState
+from cedargrove_scale.profiler import Profiler
+from cedargrove_scale.memory import MemoryManager
 from cedargrove_scale.configuration import play_tone
 from cedargrove_scale.configuration import LoadCellConfig, Colors, Display, NVM
 import cedargrove_widgets.scale
 from scale_defaults import Defaults
 
+boot_t0 = time.monotonic()  # Boot-to-ready timer
 gc.collect()
 
 DEBUG = False  # True: button outlines will display
@@ -90,17 +104,70 @@ display.brightness = Defaults.BRIGHTNESS
 nvm = NVM()
 
 # Instantiate load cell ADC FeatherWing or fake if FeatherWing not found
+if Defaults.NAU7802_DRDY_PIN:
+    drdy_pin = getattr(board, Defaults.NAU7802_DRDY_PIN)
+else:
+    drdy_pin = None
 try:
-    nau7802 = NAU7802(board.I2C(), address=0x2A, active_channels=2)
+    nau7802 = NAU7802(board.I2C(), address=0x2A, active_channels=2, drdy_pin=drdy_pin)
     print("* NAU7802 FeatherWing FOUND")
 except:
     nau7802 = FakeNAU7802(None, address=0x2A, active_channels=2)
-    print("*** ERROR: NAU7802 FeatherWing NOT FOUND; random data will be displayed")
+    print("*** ERROR: NAU7802 FeatherWing NOT FOUND; simulated data will be displayed")
+
+# Instantiate a sample filter for each load cell channel
+filters = {
+    1: FilterChain.from_spec(LoadCellConfig.FILTER_1),
+    2: FilterChain.from_spec(LoadCellConfig.FILTER_2),
+}
+
+# Instantiate a fixed-point raw count to milligram converter for each channel
+converters = {}
+for channel, points, ratio in (
+    (1, LoadCellConfig.CALIB_POINTS_1, LoadCellConfig.CALIB_RATIO_1),
+    (2, LoadCellConfig.CALIB_POINTS_2, LoadCellConfig.CALIB_RATIO_2),
+):
+    if points:
+        converters[channel] = CalibrationCurve(points)  # Multi-point
+    else:
+        converters[channel] = MassConverter(ratio)
+MAX_MG = grams_to_mg(Defaults.MAX_GR)
+
+# Instantiate a settled reading detector for each load cell channel
+detectors = {
+    1: StabilityDetector(
+        window=LoadCellConfig.STABLE_WINDOW,
+        band=converters[1].to_counts(grams_to_mg(LoadCellConfig.STABLE_BAND_GR)),
+        duration=LoadCellConfig.STABLE_TIME,
+    ),
+    2: StabilityDetector(
+        window=LoadCellConfig.STABLE_WINDOW,
+        band=converters[2].to_counts(grams_to_mg(LoadCellConfig.STABLE_BAND_GR)),
+        duration=LoadCellConfig.STABLE_TIME,
+    ),
+}
+
+# Instantiate an automatic zero tracker for each load cell channel
+trackers = {}
+for channel in (1, 2):
+    trackers[channel] = ZeroTracker(
+        band=converters[channel].to_counts(
+            grams_to_mg(LoadCellConfig.ZERO_TRACK_BAND_GR)
+        ),
+        rate=converters[channel].to_counts(
+            grams_to_mg(LoadCellConfig.ZERO_TRACK_RATE_GR)
+        ),
+        limit=converters[channel].to_counts(
+            grams_to_mg(LoadCellConfig.ZERO_TRACK_LIMIT_GR)
+        ),
+    )
+    trackers[channel].enable = LoadCellConfig.ZERO_TRACK
 
 
 def read_settings():
     """Read settings from NVM."""
     global alarm_1_mass_gr, alarm_2_mass_gr, tare_1_mass_gr, tare_2_mass_gr, alarm_1_enable, alarm_2_enable, tare_1_enable, tare_2_enable
+    global alarm_1_mass_mg, alarm_2_mass_mg, tare_1_mass_mg, tare_2_mass_mg
 
     settings = nvm.fetch_settings()
 
@@ -113,6 +180,12 @@ def read_settings():
     tare_2_mass_gr = round(settings[3], 1)
     labels.tare_2_value.text = str(tare_2_mass_gr)
 
+    # Integer milligram equivalents for the measurement loop
+    alarm_1_mass_mg = grams_to_mg(alarm_1_mass_gr)
+    alarm_2_mass_mg = grams_to_mg(alarm_2_mass_gr)
+    tare_1_mass_mg = grams_to_mg(tare_1_mass_gr)
+    tare_2_mass_mg = grams_to_mg(tare_2_mass_gr)
+
     alarm_1_enable = bool(settings[4])
     alarm_2_enable = bool(settings[5])
     tare_1_enable = bool(settings[6])
@@ -122,76 +195,150 @@ def read_settings():
 
 def zero_channel():
     """Initiate internal calibration for currently enabled channel. Returns
-    a raw zero offset value. Use when scale is started, a new channel is
-    selected, or to adjust for measurement drift. NOTE: Remove weight and tare
-    from load cell before executing."""
+    True if the internal and offset calibrations both succeeded. Use when
+    scale is started, a new channel is selected, or to adjust for measurement
+    drift. NOTE: Remove weight and tare from load cell before executing."""
     labels.status_label.text = " "
     labels.status_label.text = "ZERO LOAD CELL " + str(nau7802.channel)
     labels.status_label.color = Colors.YELLOW
+    internal = nau7802.calibrate("INTERNAL")
+    print("  channel %1d calibrate.INTERNAL: %5s" % (nau7802.channel, internal))
+    offset = nau7802.calibrate("OFFSET")
     print(
-        "  channel %1d calibrate.INTERNAL: %5s"
-        % (nau7802.channel, nau7802.calibrate("INTERNAL"))
-    )
-    print(
-        "  channel %1d calibrate.OFFSET:   %5s ..."
-        % (nau7802.channel, nau7802.calibrate("OFFSET")),
+        "  channel %1d calibrate.OFFSET:   %5s ..." % (nau7802.channel, offset),
         end="",
     )
     print(" channel zeroed")
+    filters[nau7802.channel].reset()
+    detectors[nau7802.channel].reset()
+    trackers[nau7802.channel].reset()
     labels.status_label.text = " "
+    ui.invalidate("status_text", "status_color")
+    return bool(internal and offset)
+
+
+def restore_channel():
+    """Restore the currently selected channel's calibration from NVM. If no
+    calibration is stored, calibrate and zero the channel and store the
+    resulting calibration in NVM. A failed calibration is not stored."""
+    calibration = nvm.fetch_calibration(nau7802.channel)
+    if calibration:
+        nau7802.load_calibration(calibration)
+        print("  channel %1d calibration restored" % nau7802.channel)
+        return
+    if zero_channel():
+        nvm.write_calibration(nau7802.channel, nau7802.save_calibration())
+    else:
+        print("  channel %1d calibration FAILED; not stored" % nau7802.channel)
     return
 
 
-def read(samples=LoadCellConfig.SAMPLE_AVG):
-    """Read and average consecutive raw sample values for currently selected
-    channel. Returns the average raw value."""
-    sample_sum = 0
-    sample_count = samples
-    while sample_count > 0:
-        while not nau7802.available():
-            pass
-        sample_sum = sample_sum + nau7802.read()
-        sample_count -= 1
-    return int(sample_sum / samples)
+def start_zero(channel):
+    """Start a non-blocking channel selection followed by an internal and
+    offset calibration. Progress is advanced by update_zero() in the main
+    loop. NOTE: Remove weight and tare from load cell before executing."""
+    global zero_select, zero_resume_ms, zero_ok
+    labels.status_label.text = " "
+    labels.status_label.text = "ZERO LOAD CELL " + str(channel)
+    labels.status_label.color = Colors.YELLOW
+    ui.invalidate("status_text", "status_color")
+    zero_select = nau7802.channel_steps(channel)
+    zero_resume_ms = 0
+    zero_ok = True
+    zero_steps.extend(["INTERNAL", "OFFSET"])
+    return
+
+
+def update_zero():
+    """Advance the channel selection and the queued zero calibration steps.
+    Returns True while a calibration is in progress. The calibration is
+    stored in NVM only if every step succeeded."""
+    global zero_select, zero_resume_ms, zero_ok
+    if not zero_steps:
+        return False
+    if zero_select is not None:
+        # Select and settle the channel one step at a time
+        now = time.monotonic_ns() // 1000000
+        if now < zero_resume_ms:
+            return True
+        try:
+            zero_resume_ms = now + int(next(zero_select) * 1000)
+        except StopIteration:
+            zero_select = None
+            nau7802.start_calibration(zero_steps[0])
+        return True
+    if nau7802.calibration_pending():
+        return True
+    mode = zero_steps.pop(0)
+    result = nau7802.calibration_result()
+    zero_ok = zero_ok and bool(result)
+    print("  channel %1d calibrate.%-9s %5s" % (nau7802.channel, mode + ":", result))
+    if zero_steps:
+        nau7802.start_calibration(zero_steps[0])
+        return True
+    filters[nau7802.channel].reset()
+    detectors[nau7802.channel].reset()
+    trackers[nau7802.channel].reset()
+    if zero_ok:
+        print("  channel zeroed")
+        nvm.write_calibration(nau7802.channel, nau7802.save_calibration())
+    else:
+        print("  channel %1d calibration FAILED; not stored" % nau7802.channel)
+    labels.status_label.text = " "
+    ui.invalidate("status_text")
+    return False
+
+
+def process(channel, raw):
+    """Pass a raw sample of the channel through the channel's filter,
+    stability detector, and zero tracker. Returns the zero-tracked settled raw
+    value if the channel is stable; the zero-tracked filtered raw value
+    otherwise."""
+    value = filters[channel].update(raw)
+    detector = detectors[channel]
+    detector.update(value)
+    if detector.stable:
+        value = detector.settled
+    return trackers[channel].update(value, detector.stable)
 
 
 def plot_tares():
-    """Display the tare graphics."""
+    """Display the tare graphics. Only changed properties are written."""
     if tare_1_enable:
-        labels.tare_1_value.color = Colors.ORANGE
-        panel.tare_1_icon[0] = 1
+        ui.set("tare_1_color", Colors.ORANGE)
+        ui.set("tare_1_icon", 1)
     else:
-        labels.tare_1_value.color = Colors.GRAY
-        panel.tare_1_icon[0] = 3
+        ui.set("tare_1_color", Colors.GRAY)
+        ui.set("tare_1_icon", 3)
 
     if tare_2_enable:
-        labels.tare_2_value.color = Colors.GREEN
-        panel.tare_2_icon[0] = 5
+        ui.set("tare_2_color", Colors.GREEN)
+        ui.set("tare_2_icon", 5)
     else:
-        labels.tare_2_value.color = Colors.GRAY
-        panel.tare_2_icon[0] = 7
+        ui.set("tare_2_color", Colors.GRAY)
+        ui.set("tare_2_icon", 7)
     return
 
 
 def plot_alarms():
-    """Display the alarms graphics."""
+    """Display the alarms graphics. Only changed properties are written."""
     if alarm_1_enable:
-        dial.alarm1 = alarm_1_mass_gr / Defaults.MAX_GR
-        labels.alarm_1_value.color = Colors.ORANGE
-        panel.alarm_1_icon[0] = 0
+        ui.set("alarm_1_marker", alarm_1_mass_gr / Defaults.MAX_GR)
+        ui.set("alarm_1_color", Colors.ORANGE)
+        ui.set("alarm_1_icon", 0)
     else:
-        dial.alarm1 = None
-        labels.alarm_1_value.color = Colors.GRAY
-        panel.alarm_1_icon[0] = 2
+        ui.set("alarm_1_marker", None)
+        ui.set("alarm_1_color", Colors.GRAY)
+        ui.set("alarm_1_icon", 2)
 
     if alarm_2_enable:
-        dial.alarm2 = alarm_2_mass_gr / Defaults.MAX_GR
-        labels.alarm_2_value.color = Colors.GREEN
-        panel.alarm_2_icon[0] = 4
+        ui.set("alarm_2_marker", alarm_2_mass_gr / Defaults.MAX_GR)
+        ui.set("alarm_2_color", Colors.GREEN)
+        ui.set("alarm_2_icon", 4)
     else:
-        dial.alarm2 = None
-        labels.alarm_2_value.color = Colors.GRAY
-        panel.alarm_2_icon[0] = 6
+        ui.set("alarm_2_marker", None)
+        ui.set("alarm_2_color", Colors.GRAY)
+        ui.set("alarm_2_icon", 6)
     return
 
 
@@ -207,107 +354,189 @@ scale_group.append(dial)
 dial.hand1 = dial.hand2 = 0
 display.show(scale_group)
 
+# Register the display properties that are updated while measuring
+ui = DisplayState()
+ui.add("status_text", labels.status_label, "text")
+ui.add("status_color", labels.status_label, "color")
+ui.add("chan_1_text", labels.chan_1_value, "text")
+ui.add("chan_1_color", labels.chan_1_value, "color")
+ui.add("chan_2_text", labels.chan_2_value, "text")
+ui.add("chan_2_color", labels.chan_2_value, "color")
+ui.add("hand_1", dial, "hand1")
+ui.add("hand_2", dial, "hand2")
+ui.add("tare_1_color", labels.tare_1_value, "color")
+ui.add("tare_1_icon", panel.tare_1_icon)
+ui.add("tare_2_color", labels.tare_2_value, "color")
+ui.add("tare_2_icon", panel.tare_2_icon)
+ui.add("alarm_1_marker", dial, "alarm1")
+ui.add("alarm_1_color", labels.alarm_1_value, "color")
+ui.add("alarm_1_icon", panel.alarm_1_icon)
+ui.add("alarm_2_marker", dial, "alarm2")
+ui.add("alarm_2_color", labels.alarm_2_value, "color")
+ui.add("alarm_2_icon", panel.alarm_2_icon)
+
 # Instantiate and calibrate load cell inputs
 print("* Instantiate and calibrate load cells")
-print("  enable NAU7802 digital and analog power: %5s" % (nau7802.enable(True)))
+# Digital and analog power were enabled when the NAU7802 was instantiated
 
 nau7802.gain = LoadCellConfig.PGA_GAIN  # Use default gain
-nau7802.channel = 1  # Set to first channel
-if not DEBUG:
-    zero_channel()  # Re-calibrate and zero
-nau7802.channel = 2  # Set to second channel
-if not DEBUG:
-    zero_channel()  # Re-calibrate and zero
+nau7802.conversion_rate = LoadCellConfig.CONVERSION_RATE  # Use default rate
+nau7802.settle_mode = LoadCellConfig.SETTLE_MODE  # Channel switch settling
 
-# Get default or stored alarm and tare values from NVM
+# Get default or stored alarm, tare, and calibration values from NVM
 print("* Read default or stored alarm and tare settings")
 read_settings()
 plot_tares()
 plot_alarms()
 
-alarm = False
-
-print("*** READY ***")
-labels.flash_status("READY", 0.5)
-play_tone("high")
-play_tone("low")
+nau7802.channel = 1  # Set to first channel
+if not DEBUG:
+    restore_channel()  # Restore stored calibration or re-calibrate and zero
+nau7802.channel = 2  # Set to second channel
+if not DEBUG:
+    restore_channel()  # Restore stored calibration or re-calibrate and zero
 
-# -- Main loop: Read sample, move bubble, and display values
-while True:
-    t0 = time.monotonic()  # Initiate the display frame rate clock
-    labels.heartbeat(None)  # Blank the heartbeat indicator
+# Status messages are built once rather than on every display frame
+ALARM_MESSAGES = {
+    1: ("ALARM: " + Defaults.CHAN_1_NAME).upper(),
+    2: ("ALARM: " + Defaults.CHAN_2_NAME).upper(),
+    3: ("ALARM: " + Defaults.CHAN_1_NAME + " and " + Defaults.CHAN_2_NAME).upper(),
+}
+ZERO_MESSAGES = {1: "ZERO LOAD CELL 1", 2: "ZERO LOAD CELL 2"}
 
+alarm = False
+chan_1_mass_mg = chan_2_mass_mg = 0  # Integer milligrams
+zero_steps = []  # Pending non-blocking zero calibration modes
+zero_select = None  # Channel selection step sequence of a pending zero
+zero_resume_ms = 0  # Time of the next channel selection step
+zero_ok = True  # All steps of the pending zero succeeded
+alarm_1_active = alarm_2_active = False  # Alarm state at the last check
+settings_changed = False  # Settings are waiting to be stored in NVM
+heartbeat = False
+settle_switches = nau7802.settle_stats[0]  # Switches seen by the profiler
+
+# Instantiate the continuous sampler; channels settle without blocking
+sampler = Sampler(nau7802, channels=(1, 2), size=16, dwell=LoadCellConfig.DWELL)
+raw_samples = array("i", [0] * 16)  # Drained raw sample buffer
+
+
+def acquire():
+    """Acquisition task: store a ready conversion and update the channel mass
+    values from the new samples. Measurements pause while a channel is being
+    zeroed. Only polls that store a sample are timed as reads; the channel
+    settling time is taken from the NAU7802 settling counters."""
+    global chan_1_mass_mg, chan_2_mass_mg, settle_switches
+    if zero_steps:
+        return
+    start = time.monotonic_ns()
+    if not sampler.update():
+        return
+    for channel in (1, 2):
+        count = sampler.drain(channel, raw_samples)
+        if count == 0:
+            continue
+        for i in range(count):
+            value = process(channel, raw_samples[i])
+        if channel == 1:
+            tare = tare_1_mass_mg if tare_1_enable else 0
+            chan_1_mass_mg = converters[1].to_mg(value) - tare
+        else:
+            tare = tare_2_mass_mg if tare_2_enable else 0
+            chan_2_mass_mg = converters[2].to_mg(value) - tare
+    profiler.phase("reads").record((time.monotonic_ns() - start) // 1000)
+
+    # Record the mux settling time once per completed channel switch
+    switches, _, _, duration = nau7802.settle_stats
+    if switches != settle_switches:
+        settle_switches = switches
+        profiler.phase("settle").record(int(duration * 1000000))
+
+
+def zero():
+    """Zero calibration task: advance a zero calibration in progress."""
+    if zero_steps and not update_zero():
+        sampler.restart()  # Reselect the sampler's channel after zeroing
+
+
+def refresh():
+    """Display task: update the values, dial hands, and status message, then
+    refresh the display. Only changed display properties are written."""
+    with profiler.phase("labels"):
+        update_labels()
+    if not zero_steps:
+        with profiler.phase("dial"):
+            ui.set("hand_1", chan_1_mass_mg / MAX_MG)
+            ui.set("hand_2", chan_2_mass_mg / MAX_MG)
+    with profiler.phase("refresh"):
+        display.refresh()
+
+
+def update_labels():
+    """Update the tare, alarm, value, and status labels and icons."""
     plot_tares()
     plot_alarms()
+    if zero_steps:
+        return  # The status area shows the zeroing message
 
-    if not alarm:
-        labels.status_label.text = Defaults.NAME
-        labels.status_label.color = Colors.CYAN
-
-    # Read channel 1 and update display
-    nau7802.channel = 1
-    value = read()
-    if tare_1_enable:
-        tare = tare_1_mass_gr
+    ui.set("chan_1_text", format_mass(chan_1_mass_mg))
+    if detectors[1].stable:
+        ui.set("chan_1_color", Colors.WHITE)
     else:
-        tare = 0
-    chan_1_mass_gr = round(value * LoadCellConfig.CALIB_RATIO_1, 1) - tare
-    chan_1_mass_oz = round(chan_1_mass_gr * 0.03527, 2)
-    if str(chan_1_mass_gr) == "-0.0":  # Filter -0.0 value
-        chan_1_mass_gr = 0.0
-    labels.chan_1_value.text = "%5.1f" % (chan_1_mass_gr)
-
-    # Read channel 2 and update display
-    nau7802.channel = 2
-    value = read()
-    if tare_2_enable:
-        tare = tare_2_mass_gr
+        ui.set("chan_1_color", Colors.GRAY)  # Load is changing
+    ui.set("chan_2_text", format_mass(chan_2_mass_mg))
+    if detectors[2].stable:
+        ui.set("chan_2_color", Colors.WHITE)
     else:
-        tare = 0
-    chan_2_mass_gr = round(value * LoadCellConfig.CALIB_RATIO_2, 1) - tare
-    chan_2_mass_oz = round(chan_2_mass_gr * 0.03527, 2)
-    if str(chan_2_mass_gr) == "-0.0":  # Filter -0.0 value
-        chan_2_mass_gr = 0.0
-    labels.chan_2_value.text = "%5.1f" % (chan_2_mass_gr)
-
-    chan_1_mass_gr_norm = chan_1_mass_gr / Defaults.MAX_GR
-    chan_2_mass_gr_norm = chan_2_mass_gr / Defaults.MAX_GR
-    dial.hand1 = chan_1_mass_gr_norm
-    dial.hand2 = chan_2_mass_gr_norm
-
-    print("(%+5.1f, %+5.1f)" % (chan_1_mass_gr, chan_2_mass_gr))
-
-    time.sleep(1)
-
-    labels.heartbeat(0)  # Set heartbeat indicator to Maroon
-
-    # Check alarms
-    a1 = a2 = False
-    if alarm_1_enable and chan_1_mass_gr >= alarm_1_mass_gr:
-        a1 = True
-        play_tone("low")
-        labels.status_label.color = Colors.RED
-
-    if alarm_2_enable and chan_2_mass_gr >= Defaults.ALARM_2_MASS_GR:
-        a2 = True
-        play_tone("high")
-        labels.status_label.color = Colors.RED
+        ui.set("chan_2_color", Colors.GRAY)  # Load is changing
+
+    if alarm:
+        return  # The status area shows the alarm message
+
+    # Zero tracking has absorbed all the drift it may; request a re-zero
+    for channel in (1, 2):
+        if trackers[channel].limited:
+            ui.set("status_text", ZERO_MESSAGES[channel])
+            ui.set("status_color", Colors.YELLOW)
+            return
+    ui.set("status_text", Defaults.NAME)
+    ui.set("status_color", Colors.CYAN)
+
+
+def check_alarms():
+    """Alarm task: compare the channel masses to the alarm settings."""
+    global alarm, alarm_1_active, alarm_2_active
+    a1 = alarm_1_enable and chan_1_mass_mg >= alarm_1_mass_mg
+    a2 = alarm_2_enable and chan_2_mass_mg >= alarm_2_mass_mg
+
+    # Sound the blocking tone only when an alarm starts
+    if a1 and not alarm_1_active:
+        with profiler.phase("tone"):
+            play_tone("low")
+    if a2 and not alarm_2_active:
+        with profiler.phase("tone"):
+            play_tone("high")
+    alarm_1_active = a1
+    alarm_2_active = a2
 
     if a1 and a2:
-        labels.status_label.text = (
-            "ALARM: " + Defaults.CHAN_1_NAME + " and " + Defaults.CHAN_2_NAME
-        ).upper()
-        # labels.status_label.color = Colors.RED
+        ui.set("status_text", ALARM_MESSAGES[3])
     elif a1:
-        labels.status_label.text = ("ALARM: " + Defaults.CHAN_1_NAME).upper()
-        # labels.status_label.color = Colors.RED
+        ui.set("status_text", ALARM_MESSAGES[1])
     elif a2:
-        labels.status_label.text = ("ALARM: " + Defaults.CHAN_2_NAME).upper()
-        # labels.status_label.color = Colors.RED
+        ui.set("status_text", ALARM_MESSAGES[2])
+    if a1 or a2:
+        ui.set("status_color", Colors.RED)
     alarm = a1 or a2
 
-    # Check touchscreen for button presses
-    button_pressed, hold_time = panel.read_buttons()
+
+def poll_touch():
+    """Touch task: act on a released touchscreen button."""
+    global alarm_1_mass_gr, alarm_2_mass_gr, tare_1_mass_gr, tare_2_mass_gr, alarm_1_enable, alarm_2_enable, tare_1_enable, tare_2_enable
+    global alarm_1_mass_mg, alarm_2_mass_mg, tare_1_mass_mg, tare_2_mass_mg
+    global settings_changed
+
+    with profiler.phase("touch"):
+        button_pressed, hold_time = panel.poll_buttons()
     if button_pressed == "reset":
         if hold_time > panel.timeout:
             print("* RESTORE default settings")
@@ -315,17 +544,13 @@ while True:
             read_settings()
             play_tone("low", 3)
             labels.flash_status("SETTINGS RESTORED", 1.0)
+            ui.invalidate("status_text", "status_color")
 
-    if button_pressed in ("zero_1", "zero_2"):
-        # Zero and recalibrate channel
+    if button_pressed in ("zero_1", "zero_2") and not zero_steps:
+        # Zero and recalibrate channel without blocking the display
         channel = int(button_pressed[5])
         play_tone("high")
-        nau7802.channel = channel
-
-        if channel == 1:
-            zero_channel()
-        else:
-            zero_channel()
+        start_zero(channel)
 
     if button_pressed in ("tare_1", "tare_2"):
         # Enable or disable tares; hold to set new tare value
@@ -333,8 +558,6 @@ while True:
         play_tone("high")
         if hold_time <= panel.timeout:
             # Enable/disable tares
-            nau7802.channel = channel
-
             if channel == 1:
                 tare_1_enable = not tare_1_enable  # toggle tare 1 state
                 if tare_1_enable:
@@ -350,27 +573,15 @@ while True:
             plot_tares()
         else:
             if channel == 1:
-                tare_1_mass_gr = chan_1_mass_gr
+                tare_1_mass_mg = chan_1_mass_mg
+                tare_1_mass_gr = mg_to_grams(tare_1_mass_mg)
                 labels.tare_1_value.text = str(tare_1_mass_gr)
             if channel == 2:
-                tare_2_mass_gr = chan_2_mass_gr
+                tare_2_mass_mg = chan_2_mass_mg
+                tare_2_mass_gr = mg_to_grams(tare_2_mass_mg)
                 labels.tare_2_value.text = str(tare_2_mass_gr)
             print("* Set tare", channel)
-
-        # Store updated settings in NVM
-        settings = [
-            alarm_1_mass_gr,
-            alarm_2_mass_gr,
-            tare_1_mass_gr,
-            tare_2_mass_gr,
-            alarm_1_enable,
-            alarm_2_enable,
-            tare_1_enable,
-            tare_2_enable,
-        ]
-        nvm.write_settings(list=settings)
-        play_tone("high")
-        labels.flash_status("STORED", 0.5)
+        settings_changed = True  # Store updated settings in NVM
 
     if button_pressed in ("alarm_1", "alarm_2"):
         # Enable/disable alarms
@@ -384,30 +595,125 @@ while True:
             plot_alarms()
         else:
             if channel == 1:
-                alarm_1_mass_gr = chan_1_mass_gr
+                alarm_1_mass_mg = chan_1_mass_mg
+                alarm_1_mass_gr = mg_to_grams(alarm_1_mass_mg)
                 labels.alarm_1_value.text = str(alarm_1_mass_gr)
             if channel == 2:
-                alarm_2_mass_gr = chan_2_mass_gr
+                alarm_2_mass_mg = chan_2_mass_mg
+                alarm_2_mass_gr = mg_to_grams(alarm_2_mass_mg)
                 labels.alarm_2_value.text = str(alarm_2_mass_gr)
             print("* Set alarm", channel)
-
-        # Store updated settings in NVM
-        settings = [
-            alarm_1_mass_gr,
-            alarm_2_mass_gr,
-            tare_1_mass_gr,
-            tare_2_mass_gr,
-            alarm_1_enable,
-            alarm_2_enable,
-            tare_1_enable,
-            tare_2_enable,
-        ]
+        settings_changed = True  # Store updated settings in NVM
+
+
+def store_settings():
+    """NVM task: store changed alarm and tare settings."""
+    global settings_changed
+    if not settings_changed:
+        return
+    settings = [
+        alarm_1_mass_gr,
+        alarm_2_mass_gr,
+        tare_1_mass_gr,
+        tare_2_mass_gr,
+        alarm_1_enable,
+        alarm_2_enable,
+        tare_1_enable,
+        tare_2_enable,
+    ]
+    with profiler.phase("nvm"):
         nvm.write_settings(list=settings)
-        play_tone("high")
-        labels.flash_status("STORED", 0.5)
+    settings_changed = False
+    play_tone("high")
+    labels.flash_status("STORED", 0.5)
+    ui.invalidate("status_text", "status_color")
+
+
+def telemetry():
+    """Telemetry task: blink the heartbeat and report to the REPL."""
+    global heartbeat
+    heartbeat = not heartbeat
+    if heartbeat:
+        labels.heartbeat(0)  # Set heartbeat indicator to Maroon
+    else:
+        labels.heartbeat(None)  # Blank the heartbeat indicator
+    print("(%s, %s)" % (format_mass(chan_1_mass_mg), format_mass(chan_2_mass_mg)))
+    print(f"free memory: {memory.free} bytes")
+    if scheduler.task("telemetry").runs % REPORT_INTERVAL == REPORT_INTERVAL - 1:
+        report()
+
+
+def report():
+    """Print the task, phase, and display statistics to the REPL."""
+    scheduler.report()
+    profiler.report()
+    memory.report()
+    print("  display writes: %d  unchanged: %d" % ui.stats)
+    ui.reset_stats()
+
+
+def console():
+    """Serial console task: act on a command character from the REPL.
+    'p' prints the statistics report; 'r' clears the statistics."""
+    if not supervisor.runtime.serial_bytes_available:
+        return
+    command = sys.stdin.read(1)
+    if command == "p":
+        report()
+    elif command == "r":
+        for task in scheduler.tasks:
+            task.reset_stats()
+        profiler.reset()
+        memory.reset_stats()
+        ui.reset_stats()
+        print("* Statistics cleared")
+
+
+# Time the main loop phases; durations in microseconds
+# The mux settling time elapses between reads, so it has no share
+profiler = Profiler(
+    ("reads", "settle", "labels", "dial", "refresh", "touch", "tone", "nvm", "gc"),
+    overlapping=("settle",),
+)
+REPORT_INTERVAL = 60  # Telemetry task runs between statistics reports
+
+
+def idle(seconds):
+    """Idle function: collect garbage when memory is low or the schedule
+    has enough slack; time managed collections as the gc phase."""
+    if memory.update(seconds):
+        profiler.phase("gc").record(memory.last_duration)
 
-    # End of display frame cleanup
-    gc.collect()
-    free_memory = gc.mem_free()
-    frame = time.monotonic() - t0
-    print(f"frame: {frame:5.2f} sec   free memory: {free_memory} bytes")
+
+# Schedule the main loop tasks; period and deadline in seconds
+scheduler = Scheduler()
+# Poll for a conversion twice per conversion interval so the loop can idle
+scheduler.add(
+    "acquire",
+    acquire,
+    period=0.5 / LoadCellConfig.CONVERSION_RATE,
+    deadline=1 / LoadCellConfig.CONVERSION_RATE,
+)
+scheduler.add("zero", zero, period=0.05)
+scheduler.add("display", refresh, period=0.1, deadline=0.05)
+scheduler.add("alarms", check_alarms, period=0.25)
+scheduler.add("touch", poll_touch, period=0.05)
+scheduler.add("nvm", store_settings, period=1.0)
+scheduler.add("telemetry", telemetry, period=1.0)
+scheduler.add("console", console, period=0.25)
+
+print("  NAU7802 startup time: %5.3f sec" % nau7802.startup_time)
+print("*** READY *** boot time: %5.2f sec" % (time.monotonic() - boot_t0))
+labels.flash_status("READY", 0.5)
+ui.invalidate("status_text", "status_color")
+play_tone("high")
+play_tone("low")
+
+# The display task refreshes the display at its scheduled rate from here on
+display.auto_refresh = False
+
+# -- Main loop: Run the acquisition, display, touch, alarm, NVM, and
+#    telemetry tasks
+gc.collect()
+memory = MemoryManager()  # Collects only when memory is low or during idle time
+scheduler.run(idle_function=idle)
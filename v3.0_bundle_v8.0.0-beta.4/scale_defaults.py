@@ -36,13 +36,23 @@ class Defaults:
 
     """Enter the calibration ratio for the individual load cell in-use. The
     ratio is composed of the reference weight in grams divided by the raw
-    reading. For example, a raw reading of 215300 for a 100 gram weight results
-    in a calibration ratio of 100 / 215300. Use the clue_scale_single_calibrate
+    reading. For example, a raw reading of 107650 for a 100 gram weight results
+    in a calibration ratio of 100 / 107650. Use the clue_scale_single_calibrate
     method to obtain the raw value.
     FYI: A US dime coin weighs 2.268 grams or 0.079 ounces."""
 
-    LOADCELL_1_CALIBRATION = 100 / 215300  # channel 1 load cell serial#4540-01
-    LOADCELL_2_CALIBRATION = 100 / 215300  # channel 2 load cell serial#4540-02
+    LOADCELL_1_CALIBRATION = 100 / 107650  # channel 1 load cell serial#4540-01
+    LOADCELL_2_CALIBRATION = 100 / 107650  # channel 2 load cell serial#4540-02
+
+    """Optionally enter multi-point calibrations to correct load cell
+    non-linearity. Each point is the raw reading and the reference weight in
+    grams, for example ((53800, 50), (107650, 100), (215500, 200)). Include a
+    measured zero-load point, for example (150, 0), to use it as the zero of
+    the curve; otherwise a (0, 0) point is assumed. Points replace the
+    calibration ratio of the channel. None uses the ratio."""
+
+    LOADCELL_1_CALIBRATION_POINTS = None  # channel 1 (raw, grams) points
+    LOADCELL_2_CALIBRATION_POINTS = None  # channel 2 (raw, grams) points
 
     """DISPLAY_NAME -- choose unique descriptor string from:
       TFT FeatherWing - 2.4" 320x240 Touchscreen
@@ -58,6 +68,12 @@ class Defaults:
     # CALIBRATION = ((357, 3812), (390, 3555))  # 2.4" FeatherWing touchscreen
     # CALIBRATION = ((357, 3812), (390, 3555))  # 3.5" FeatherWing touchscreen
 
+    """NAU7802_DRDY_PIN -- the board pin name (for example "D5") connected to
+    the NAU7802 DRDY output. Data-ready is then signalled by the pin level rather
+    than by polling the NAU7802 over I2C. Use None if DRDY is not connected."""
+
+    NAU7802_DRDY_PIN = None
+
     BRIGHTNESS = 0.75  # Display brightness, 0 to 1.0; 0.75 typical, 0.1 for photos
 
     MAX_GR = 100  # Maximum (full-scale) display range in grams